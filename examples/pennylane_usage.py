@@ -48,9 +48,10 @@ print(f"\nVariational circuit expectation value: {expval}")
 from qbom.core.session import Session
 
 session = Session.get()
-print(f"\nCaptured {len(session._traces)} traces")
+traces = list(session.iter_all_traces())
+print(f"\nCaptured {len(traces)} traces")
 
-for trace in session._traces:
+for trace in traces:
     print(f"  - {trace.id}: {trace.summary}")
     trace.export(f"{trace.id}.qbom.json")
 
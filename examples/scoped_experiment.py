@@ -67,5 +67,5 @@ from qbom.core.session import Session
 
 session = Session.get()
 print("\nAll traces from this session:")
-for trace in session._traces:
+for trace in session.iter_all_traces():
     print(f"  - {trace.id}: {trace.metadata.name}")
@@ -25,17 +25,32 @@ Licensed under Apache 2.0
 __version__ = "0.1.0"
 __author__ = "CSNP"
 
-from qbom.core.session import Session, current, export, show
-from qbom.core.trace import Trace
+from typing import TYPE_CHECKING
+
+from qbom.core.session import Session, current, export, pause, show
+
+if TYPE_CHECKING:
+    from qbom.core.trace import Trace
 
 __all__ = [
     "Trace",
     "Session",
     "current",
     "export",
+    "pause",
     "show",
     "__version__",
 ]
 
+
+def __getattr__(name: str) -> object:
+    # Trace pulls in pydantic and the models; load it on first use
+    if name == "Trace":
+        from qbom.core.trace import Trace
+
+        return Trace
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Auto-initialize on import
 Session.auto_start()
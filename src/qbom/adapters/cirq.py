@@ -11,11 +11,14 @@ Captures Cirq operations for Google quantum hardware and simulators:
 from __future__ import annotations
 
 import functools
-import hashlib
-from datetime import datetime
+import sys
+import time
+import weakref
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 from qbom.adapters.base import Adapter
+from qbom.core.hashing import UNKNOWN_HASH, hash_counts, new_hasher
 from qbom.core.models import (
     Circuit,
     Counts,
@@ -25,56 +28,144 @@ from qbom.core.models import (
     Result,
 )
 
+np: Any  # numpy module, or None without it
+try:
+    import numpy as np  # Cirq dependency
+except ImportError:
+    np = None
+
 if TYPE_CHECKING:
     from qbom.core.session import Session
 
 
+# Circuit models keyed by id(circuit). Each entry remembers the frozen snapshot
+# it was built from: Circuit.freeze() returns the same object until the circuit
+# is mutated, so an identity check is a cheap invalidation signal. A frozen
+# circuit is its own snapshot and can't change, so its entry stores None
+# instead (holding the key in the value would keep it alive). Entries are
+# evicted when the circuit is garbage collected.
+_CIRCUIT_CACHE: dict[int, tuple[Any | None, Circuit]] = {}
+
+# Per gate class: (interned lowercased name, is a measurement)
+_GATE_INFO_CACHE: dict[type, tuple[str, bool]] = {}
+
+
+def _gate_info(gate_type: type, measurement_gate: type) -> tuple[str, bool]:
+    """Return the interned name and measurement flag for a gate class."""
+    info = _GATE_INFO_CACHE.get(gate_type)
+    if info is None:
+        info = _GATE_INFO_CACHE[gate_type] = (
+            sys.intern(gate_type.__name__.lower()),
+            issubclass(gate_type, measurement_gate),
+        )
+    return info
+
+
 def _hash_circuit(circuit: Any) -> str:
-    """Compute deterministic hash of a Cirq circuit."""
+    """
+    Compute deterministic hash of a Cirq circuit.
+
+    Streams the operation reprs (gate, parameters and qubits) moment by moment
+    rather than rendering the text diagram, which is quadratic in circuit size.
+    """
+    try:
+        h = new_hasher()
+        for moment in circuit:
+            for op in moment:
+                h.update(repr(op).encode())
+                h.update(b";")
+            h.update(b"|")
+        return h.hexdigest()
+    except Exception:
+        return UNKNOWN_HASH
+
+
+def _snapshot(program: Any) -> Any:
+    """Return an immutable view of a circuit for deferred capture."""
     try:
-        # Use string representation for hashing
-        circuit_str = str(circuit)
-        return hashlib.sha256(circuit_str.encode()).hexdigest()[:16]
+        return program.freeze()
     except Exception:
-        return hashlib.sha256(b"unknown").hexdigest()[:16]
+        return program
 
 
 def _circuit_to_model(circuit: Any) -> Circuit:
-    """Convert Cirq Circuit to QBOM Circuit model."""
+    """
+    Convert Cirq Circuit to QBOM Circuit model.
+
+    Repeat submissions of an unchanged circuit (parameter sweeps, VQE loops)
+    reuse the cached model instead of re-walking and re-hashing the circuit.
+    """
+    try:
+        snapshot = circuit.freeze()
+    except Exception:
+        return _build_circuit_model(circuit)
+    if snapshot is circuit:
+        snapshot = None
+
+    key = id(circuit)
+    cached = _CIRCUIT_CACHE.get(key)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    model = _build_circuit_model(circuit)
+    try:
+        if cached is None:
+            weakref.finalize(circuit, _CIRCUIT_CACHE.pop, key, None)
+        _CIRCUIT_CACHE[key] = (snapshot, model)
+    except TypeError:
+        pass  # Not weak-referenceable; skip caching
+    return model
+
+
+def _build_circuit_model(circuit: Any) -> Circuit:
+    """Walk a Cirq Circuit and build the QBOM Circuit model."""
     try:
         import cirq
 
-        # Count gates
-        gate_counts: dict[str, int] = {}
+        measurement_gate = cirq.MeasurementGate
+        gate_info = _GATE_INFO_CACHE
+
+        # Count gates, classical bits and hash in a single pass
+        gate_counts: defaultdict[str, int] = defaultdict(int)
         single_qubit = 0
         two_qubit = 0
         total = 0
+        num_clbits = 0
+        h = new_hasher()
 
         for moment in circuit:
             for op in moment:
-                gate_name = type(op.gate).__name__.lower()
-                gate_counts[gate_name] = gate_counts.get(gate_name, 0) + 1
+                gate_type = type(op.gate)
+                info = gate_info.get(gate_type)
+                if info is None:
+                    info = _gate_info(gate_type, measurement_gate)
+                gate_name, is_measurement = info
+                gate_counts[gate_name] += 1
                 total += 1
 
                 num_qubits = len(op.qubits)
+                if is_measurement:
+                    # One classical bit per measured qubit
+                    num_clbits += num_qubits
+
                 if num_qubits == 1:
                     single_qubit += 1
                 elif num_qubits == 2:
                     two_qubit += 1
 
-        gates = GateCounts(
+                h.update(repr(op).encode())
+                h.update(b";")
+            h.update(b"|")
+
+        gates = GateCounts.shared(
+            dict(gate_counts),
             single_qubit=single_qubit,
             two_qubit=two_qubit,
             total=total,
-            by_name=gate_counts,
         )
 
         # Get qubit count
-        all_qubits = circuit.all_qubits()
-        num_qubits = len(all_qubits)
-
-        # Count measurement operations for classical bits
-        num_clbits = sum(1 for op in circuit.all_operations() if isinstance(op.gate, cirq.MeasurementGate))
+        num_qubits = len(circuit.all_qubits())
 
         return Circuit(
             name=None,
@@ -82,7 +173,7 @@ def _circuit_to_model(circuit: Any) -> Circuit:
             num_clbits=num_clbits,
             depth=len(circuit),
             gates=gates,
-            hash=_hash_circuit(circuit),
+            hash=h.hexdigest(),
             qasm=None,  # Cirq uses different format
         )
     except Exception:
@@ -95,20 +186,40 @@ def _circuit_to_model(circuit: Any) -> Circuit:
         )
 
 
+@functools.lru_cache(maxsize=64)
+def _simulator_hardware(backend: str, num_qubits: int) -> Hardware:
+    """Simulator hardware record; identical for every run of the same width."""
+    return Hardware(
+        provider="Cirq",
+        backend=backend,
+        num_qubits=num_qubits,
+        is_simulator=True,
+    )
+
+
 def _extract_counts_from_result(result: Any, num_shots: int) -> Counts:
     """Extract measurement counts from Cirq result."""
     try:
         # Cirq results have measurements as numpy arrays
         counts_dict: dict[str, int] = {}
 
-        if hasattr(result, "measurements"):
+        if np is not None and hasattr(result, "measurements"):
             # Get all measurement keys
             for key in result.measurements:
-                measurement_array = result.measurements[key]
-                # Convert each shot to bitstring
-                for shot in measurement_array:
-                    bitstring = "".join(str(bit) for bit in shot)
-                    counts_dict[bitstring] = counts_dict.get(bitstring, 0) + 1
+                measurement_array = np.asarray(result.measurements[key])
+                if measurement_array.ndim != 2 or not measurement_array.size:
+                    continue
+                # Bucket identical shots in C, then build one bitstring per unique outcome
+                outcomes, frequencies = np.unique(measurement_array, axis=0, return_counts=True)
+                if outcomes.min() < 0 or outcomes.max() > 9:
+                    bitstrings = ["".join(map(str, row)) for row in outcomes.tolist()]
+                else:
+                    # Digits map to ASCII by adding ord("0"); decode all rows at once
+                    width = outcomes.shape[1]
+                    text = (outcomes.astype(np.uint8) + 48).tobytes().decode("ascii")
+                    bitstrings = [text[i : i + width] for i in range(0, len(text), width)]
+                for bitstring, frequency in zip(bitstrings, frequencies.tolist()):
+                    counts_dict[bitstring] = counts_dict.get(bitstring, 0) + frequency
 
         if not counts_dict:
             # Try histogram method if available
@@ -121,6 +232,123 @@ def _extract_counts_from_result(result: Any, num_shots: int) -> Counts:
         return Counts(raw={}, shots=num_shots)
 
 
+def _resolver_parameters(param_resolver: Any) -> dict[str, Any] | None:
+    """Extract {symbol: value} from a Cirq ParamResolver (or plain dict)."""
+    if not param_resolver:
+        return None
+    try:
+        param_dict = getattr(param_resolver, "param_dict", param_resolver)
+        parameters: dict[str, Any] = {}
+        for symbol, value in param_dict.items():
+            try:
+                parameters[str(symbol)] = float(value)
+            except (TypeError, ValueError):
+                parameters[str(symbol)] = str(value)
+        return parameters or None
+    except Exception:
+        return None
+
+
+def _mirror(wrapper: Any, original: Any) -> Any:
+    """Give a hook the identity of the method it replaces."""
+    wrapper.__name__ = original.__name__
+    wrapper.__qualname__ = original.__qualname__
+    wrapper.__doc__ = original.__doc__
+    wrapper.__wrapped__ = original
+    return wrapper
+
+
+def _make_run_wrapper(adapter: CirqAdapter, original_run: Any, backend: str) -> Any:
+    """Build a sampling hook for a simulator's run()."""
+
+    def wrapped_run(
+        self_sim: Any,
+        program: Any,
+        param_resolver: Any = None,
+        repetitions: int = 1,
+    ) -> Any:
+        if adapter.session.paused:
+            return original_run(self_sim, program, param_resolver, repetitions)
+
+        # Snapshot the circuit and resolve the parameters now, so later user
+        # mutations (e.g. a resolver dict reused across a sweep) can't leak
+        # into the trace
+        snapshot = _snapshot(program)
+        parameters = _resolver_parameters(param_resolver)
+        builder = adapter.session.detach_builder()
+
+        start_ns = time.perf_counter_ns()
+
+        # Run original
+        result = original_run(self_sim, program, param_resolver, repetitions)
+
+        end_ns = time.perf_counter_ns()
+
+        # Analysis, hashing and saving happen off the hot path
+        adapter.session.defer(
+            adapter._finish_run,
+            builder,
+            backend,
+            snapshot,
+            parameters,
+            repetitions,
+            start_ns,
+            end_ns,
+            result,
+        )
+
+        return result
+
+    return wrapped_run
+
+
+def _make_simulate_wrapper(adapter: CirqAdapter, original_simulate: Any, backend: str) -> Any:
+    """Build a state vector simulation hook for simulate()."""
+    import cirq
+
+    def wrapped_simulate(
+        self_sim: Any,
+        program: Any,
+        param_resolver: Any = None,
+        qubit_order: Any = cirq.QubitOrder.DEFAULT,  # simulate()'s own default
+        initial_state: Any = None,
+    ) -> Any:
+        if adapter.session.paused:
+            return original_simulate(self_sim, program, param_resolver, qubit_order, initial_state)
+
+        builder = adapter.session.current_builder
+
+        # Capture circuit and hardware (simulator) inline: this builder stays
+        # current and this thread keeps writing to it, so it can't be handed
+        # to the capture worker. Unchanged circuits hit the model cache.
+        adapter._capture_program(builder, backend, program)
+
+        # Run original
+        start_ns = time.perf_counter_ns()
+        result = original_simulate(self_sim, program, param_resolver, qubit_order, initial_state)
+        end_ns = time.perf_counter_ns()
+
+        # For state vector simulation, we capture the final state
+        execution = Execution(
+            shots=1,  # State vector is a single "shot"
+            completed_at=adapter.session.timestamp(end_ns),
+            duration_ns=end_ns - start_ns,
+        )
+        builder.set_execution(execution)
+
+        return result
+
+    return wrapped_simulate
+
+
+# (cirq class, method, hook factory, backend label) installed by CirqAdapter
+_HOOK_SPEC = (
+    ("Simulator", "run", _make_run_wrapper, "cirq.Simulator"),
+    ("Simulator", "simulate", _make_simulate_wrapper, "cirq.Simulator (state vector)"),
+    ("DensityMatrixSimulator", "run", _make_run_wrapper, "cirq.DensityMatrixSimulator"),
+)
+
+
 class CirqAdapter(Adapter):
     """
     Cirq framework adapter.
@@ -128,7 +356,7 @@ class CirqAdapter(Adapter):
     Hooks into:
     - cirq.Simulator.run()
     - cirq.Simulator.simulate()
-    - cirq.google.Engine.run() (if available)
+    - cirq.DensityMatrixSimulator.run()
     """
 
     name = "cirq"
@@ -144,213 +372,64 @@ class CirqAdapter(Adapter):
 
         try:
             import cirq
-
-            # Hook Simulator.run
-            self._hook_simulator_run(cirq)
-
-            # Hook Simulator.simulate (for state vector simulation)
-            self._hook_simulator_simulate(cirq)
-
-            # Hook DensityMatrixSimulator if available
-            self._hook_density_matrix_simulator(cirq)
-
-            # Hook Google Quantum Engine if available
-            self._hook_quantum_engine()
-
-            self._installed = True
         except ImportError:
-            pass  # Cirq not installed
-
-    def _hook_simulator_run(self, cirq: Any) -> None:
-        """Hook cirq.Simulator.run() for sampling."""
-        try:
-            original_run = cirq.Simulator.run
-            adapter = self
-
-            @functools.wraps(original_run)
-            def wrapped_run(
-                self_sim: Any,
-                program: Any,
-                param_resolver: Any = None,
-                repetitions: int = 1,
-                **kwargs: Any,
-            ) -> Any:
-                builder = adapter.session.current_builder
-
-                # Capture circuit
-                builder.add_circuit(_circuit_to_model(program))
-
-                # Capture hardware (simulator)
-                hardware = Hardware(
-                    provider="Cirq",
-                    backend="cirq.Simulator",
-                    num_qubits=len(program.all_qubits()),
-                    is_simulator=True,
+            return  # Cirq not installed
+
+        for class_name, method_name, make_wrapper, backend in _HOOK_SPEC:
+            cls = getattr(cirq, class_name, None)
+            if cls is None or getattr(cls, method_name, None) is None:
+                continue
+            try:
+                self._wrap_function(
+                    cls,
+                    method_name,
+                    lambda original, make=make_wrapper, label=backend: _mirror(make(self, original, label), original),
                 )
-                builder.set_hardware(hardware)
-
-                # Capture execution params
-                submitted_at = datetime.utcnow()
-
-                # Run original
-                result = original_run(self_sim, program, param_resolver, repetitions, **kwargs)
-
-                completed_at = datetime.utcnow()
-
-                # Capture execution
-                execution = Execution(
-                    shots=repetitions,
-                    submitted_at=submitted_at,
-                    completed_at=completed_at,
-                )
-                builder.set_execution(execution)
-
-                # Capture results
-                counts = _extract_counts_from_result(result, repetitions)
-                result_hash = hashlib.sha256(str(sorted(counts.raw.items())).encode()).hexdigest()[:16]
-
-                qbom_result = Result(counts=counts, hash=result_hash)
-                builder.set_result(qbom_result)
-
-                # Finalize trace
-                adapter.session.finalize_trace()
-
-                return result
-
-            cirq.Simulator.run = wrapped_run
-            self._original_functions["cirq.Simulator.run"] = (
-                cirq.Simulator,
-                "run",
-                original_run,
+            except Exception:
+                pass  # Leave this method unhooked
+
+        self._installed = True
+
+    def _capture_program(self, builder: Any, backend: str, program: Any) -> None:
+        """Record the circuit and simulator hardware on a builder."""
+        circuit = _circuit_to_model(program)
+        builder.add_circuit(circuit)
+        builder.set_hardware(_simulator_hardware(backend, circuit.num_qubits))
+
+    def _finish_run(
+        self,
+        builder: Any,
+        backend: str,
+        program: Any,
+        parameters: dict[str, Any] | None,
+        repetitions: int,
+        start_ns: int,
+        end_ns: int,
+        result: Any,
+    ) -> None:
+        """
+        Complete and finalize the trace for a sampling run (runs deferred).
+
+        In a parameter sweep the circuit structure comes from the model cache;
+        only the resolved parameter values are new for each run.
+        """
+        self._capture_program(builder, backend, program)
+
+        builder.set_execution(
+            Execution(
+                shots=repetitions,
+                parameters=parameters,
+                submitted_at=self.session.timestamp(start_ns),
+                completed_at=self.session.timestamp(end_ns),
+                duration_ns=end_ns - start_ns,
             )
-        except Exception:
-            pass
-
-    def _hook_simulator_simulate(self, cirq: Any) -> None:
-        """Hook cirq.Simulator.simulate() for state vector simulation."""
-        try:
-            original_simulate = cirq.Simulator.simulate
-            adapter = self
-
-            @functools.wraps(original_simulate)
-            def wrapped_simulate(
-                self_sim: Any,
-                program: Any,
-                param_resolver: Any = None,
-                qubit_order: Any = None,
-                initial_state: Any = None,
-            ) -> Any:
-                builder = adapter.session.current_builder
-
-                # Capture circuit
-                builder.add_circuit(_circuit_to_model(program))
-
-                # Capture hardware (simulator)
-                hardware = Hardware(
-                    provider="Cirq",
-                    backend="cirq.Simulator (state vector)",
-                    num_qubits=len(program.all_qubits()),
-                    is_simulator=True,
-                )
-                builder.set_hardware(hardware)
-
-                # Run original
-                result = original_simulate(self_sim, program, param_resolver, qubit_order, initial_state)
-
-                # For state vector simulation, we capture the final state
-                execution = Execution(
-                    shots=1,  # State vector is a single "shot"
-                    completed_at=datetime.utcnow(),
-                )
-                builder.set_execution(execution)
-
-                return result
-
-            cirq.Simulator.simulate = wrapped_simulate
-            self._original_functions["cirq.Simulator.simulate"] = (
-                cirq.Simulator,
-                "simulate",
-                original_simulate,
-            )
-        except Exception:
-            pass
-
-    def _hook_density_matrix_simulator(self, cirq: Any) -> None:
-        """Hook DensityMatrixSimulator if available."""
-        try:
-            if hasattr(cirq, "DensityMatrixSimulator"):
-                original_run = cirq.DensityMatrixSimulator.run
-                adapter = self
-
-                @functools.wraps(original_run)
-                def wrapped_run(
-                    self_sim: Any,
-                    program: Any,
-                    param_resolver: Any = None,
-                    repetitions: int = 1,
-                    **kwargs: Any,
-                ) -> Any:
-                    builder = adapter.session.current_builder
-
-                    # Capture circuit
-                    builder.add_circuit(_circuit_to_model(program))
-
-                    # Capture hardware
-                    hardware = Hardware(
-                        provider="Cirq",
-                        backend="cirq.DensityMatrixSimulator",
-                        num_qubits=len(program.all_qubits()),
-                        is_simulator=True,
-                    )
-                    builder.set_hardware(hardware)
-
-                    submitted_at = datetime.utcnow()
-                    result = original_run(self_sim, program, param_resolver, repetitions, **kwargs)
-                    completed_at = datetime.utcnow()
-
-                    execution = Execution(
-                        shots=repetitions,
-                        submitted_at=submitted_at,
-                        completed_at=completed_at,
-                    )
-                    builder.set_execution(execution)
-
-                    # Capture results
-                    counts = _extract_counts_from_result(result, repetitions)
-                    result_hash = hashlib.sha256(str(sorted(counts.raw.items())).encode()).hexdigest()[:16]
-
-                    qbom_result = Result(counts=counts, hash=result_hash)
-                    builder.set_result(qbom_result)
-
-                    adapter.session.finalize_trace()
-
-                    return result
-
-                cirq.DensityMatrixSimulator.run = wrapped_run
-                self._original_functions["cirq.DensityMatrixSimulator.run"] = (
-                    cirq.DensityMatrixSimulator,
-                    "run",
-                    original_run,
-                )
-        except Exception:
-            pass
-
-    def _hook_quantum_engine(self) -> None:
-        """Hook Google Quantum Engine for real hardware execution."""
-        try:
-            import cirq_google
-
-            if hasattr(cirq_google, "Engine"):
-                # Hook the sampler's run method
-                original_run = cirq_google.Engine.get_sampler
-                adapter = self
+        )
 
-                # This is more complex - would need to wrap the sampler
-                # For now, document that Google hardware requires additional setup
-                pass
+        # Capture results
+        counts = _extract_counts_from_result(result, repetitions)
+        builder.set_result(Result(counts=counts, hash=hash_counts(counts.raw)))
 
-        except ImportError:
-            pass  # cirq_google not installed
+        self.session.finalize_trace(builder)
 
     def uninstall(self) -> None:
         """Remove Cirq hooks."""
@@ -11,11 +11,15 @@ Captures PennyLane operations for hybrid quantum-classical workflows:
 from __future__ import annotations
 
 import functools
-import hashlib
-from datetime import datetime
+import re
+import sys
+import time
+import weakref
+from array import array
 from typing import TYPE_CHECKING, Any
 
 from qbom.adapters.base import Adapter
+from qbom.core.hashing import UNKNOWN_HASH, fingerprint, hash_counts, new_hasher
 from qbom.core.models import (
     Circuit,
     Counts,
@@ -25,9 +29,29 @@ from qbom.core.models import (
     Result,
 )
 
+np: Any  # numpy module, or None without it
+try:
+    import numpy as np  # PennyLane dependency
+except ImportError:
+    np = None
+
 if TYPE_CHECKING:
     from qbom.core.session import Session
 
+# Device-name keyword -> provider label
+_PROVIDER_MAP = {
+    "qiskit": "IBM Quantum (via PennyLane)",
+    "cirq": "Google (via PennyLane)",
+    "braket": "AWS Braket (via PennyLane)",
+    "lightning": "PennyLane Lightning",
+}
+_PROVIDER_RE = re.compile("(" + "|".join(_PROVIDER_MAP) + ")")
+# "sim" also covers "simulator"
+_SIM_RE = re.compile("default|lightning|sim")
+
+# Operation name -> interned lower-case gate name, shared by every circuit
+_GATE_NAMES: dict[str, str] = {}
+
 
 def _extract_circuit_info(tape: Any) -> Circuit:
     """Extract circuit information from a PennyLane tape."""
@@ -38,22 +62,41 @@ def _extract_circuit_info(tape: Any) -> Circuit:
         two_qubit = 0
         total = 0
 
+        h = new_hasher()
+
         for op in tape.operations:
-            gate_name = op.name.lower()
+            name = op.name
+            gate_name = _GATE_NAMES.get(name)
+            if gate_name is None:
+                gate_name = _GATE_NAMES[name] = sys.intern(name.lower())
             gate_counts[gate_name] = gate_counts.get(gate_name, 0) + 1
             total += 1
 
-            num_wires = len(op.wires)
+            wires = op.wires
+            num_wires = len(wires)
             if num_wires == 1:
                 single_qubit += 1
             elif num_wires == 2:
                 two_qubit += 1
 
-        gates = GateCounts(
+            # Hash the operation as we go (name, wires, parameters)
+            h.update(name.encode())
+            # Integer wire labels are packed straight into bytes; other labels
+            # (strings, tuples) fall back to their repr
+            labels = wires.labels
+            try:
+                h.update(array("q", labels))
+            except (TypeError, OverflowError):
+                h.update(repr(labels).encode())
+            for param in op.parameters:
+                h.update(repr(param).encode())
+            h.update(b";")
+
+        gates = GateCounts.shared(
+            gate_counts,
             single_qubit=single_qubit,
             two_qubit=two_qubit,
             total=total,
-            by_name=gate_counts,
         )
 
         # Get wire count
@@ -62,24 +105,20 @@ def _extract_circuit_info(tape: Any) -> Circuit:
         # Count measurements
         num_measurements = len(tape.measurements)
 
-        # Compute circuit hash from operations
-        ops_str = str([(op.name, op.wires.tolist(), op.parameters) for op in tape.operations])
-        circuit_hash = hashlib.sha256(ops_str.encode()).hexdigest()[:16]
-
         return Circuit(
             name=tape.name if hasattr(tape, "name") else None,
             num_qubits=num_qubits,
             num_clbits=num_measurements,
             depth=len(tape.operations),  # Simplified depth
             gates=gates,
-            hash=circuit_hash,
+            hash=h.hexdigest(),
         )
     except Exception:
         return Circuit(
             num_qubits=0,
             depth=0,
             gates=GateCounts(total=0),
-            hash=hashlib.sha256(b"unknown").hexdigest()[:16],
+            hash=UNKNOWN_HASH,
         )
 
 
@@ -90,19 +129,11 @@ def _extract_device_info(device: Any) -> Hardware:
         device_name = device.name if hasattr(device, "name") else str(type(device).__name__)
         short_name = device.short_name if hasattr(device, "short_name") else device_name
 
-        # Detect provider
-        provider = "PennyLane"
-        if "qiskit" in device_name.lower():
-            provider = "IBM Quantum (via PennyLane)"
-        elif "cirq" in device_name.lower():
-            provider = "Google (via PennyLane)"
-        elif "braket" in device_name.lower():
-            provider = "AWS Braket (via PennyLane)"
-        elif "lightning" in device_name.lower():
-            provider = "PennyLane Lightning"
-
-        # Check if simulator
-        is_simulator = any(sim in device_name.lower() for sim in ["default", "lightning", "simulator", "sim"])
+        # Detect provider and simulator status, one regex scan each
+        lname = device_name.lower()
+        match = _PROVIDER_RE.search(lname)
+        provider = _PROVIDER_MAP[match.group(1)] if match else "PennyLane"
+        is_simulator = _SIM_RE.search(lname) is not None
 
         # Get number of wires/qubits
         num_qubits = device.num_wires if hasattr(device, "num_wires") else 0
@@ -122,29 +153,48 @@ def _extract_device_info(device: Any) -> Hardware:
         )
 
 
+def _resolve_shots(device: Any) -> int:
+    """Total shots configured on a device (1 for analytic mode)."""
+    shots = getattr(device, "shots", None)
+    if isinstance(shots, int):
+        return shots
+    # Shots objects report total_shots=None in analytic mode
+    return getattr(shots, "total_shots", None) or 1
+
+
 def _process_result(result: Any, shots: int | None) -> tuple[Counts | None, str]:
     """Process PennyLane result into counts if applicable."""
     try:
         # If result is a dictionary of counts (from qml.counts())
         if isinstance(result, dict):
             counts_dict = {str(k): int(v) for k, v in result.items()}
-            total_shots = sum(counts_dict.values())
-            result_hash = hashlib.sha256(str(sorted(counts_dict.items())).encode()).hexdigest()[:16]
+            if np is not None:
+                values = np.fromiter(counts_dict.values(), dtype=np.int64, count=len(counts_dict))
+                total_shots = int(values.sum())
+            else:
+                total_shots = sum(counts_dict.values())
+            result_hash = hash_counts(counts_dict)
             return Counts(raw=counts_dict, shots=total_shots), result_hash
 
-        # If result is a numpy array or similar
+        # If result is a numpy array, hash its raw buffer (plus dtype and shape)
+        if np is not None and isinstance(result, np.ndarray) and result.dtype != object:
+            h = new_hasher()
+            h.update(f"{result.dtype.str}{result.shape}".encode())
+            h.update(np.ascontiguousarray(result).tobytes())
+            return None, h.hexdigest()
+
         if hasattr(result, "tolist"):
             result_str = str(result.tolist())
         else:
             result_str = str(result)
 
-        result_hash = hashlib.sha256(result_str.encode()).hexdigest()[:16]
+        result_hash = fingerprint(result_str)
 
         # For expectation values, we don't have counts
         return None, result_hash
 
     except Exception:
-        return None, hashlib.sha256(b"unknown").hexdigest()[:16]
+        return None, UNKNOWN_HASH
 
 
 class PennyLaneAdapter(Adapter):
@@ -184,6 +234,19 @@ class PennyLaneAdapter(Adapter):
         except ImportError:
             pass  # PennyLane not installed
 
+    def _device_info(self, device: Any) -> Hardware:
+        """Hardware record for a device, extracted once per device object."""
+        key = id(device)
+        hardware = self._active_devices.get(key)
+        if hardware is None:
+            hardware = _extract_device_info(device)
+            try:
+                weakref.finalize(device, self._active_devices.pop, key, None)
+                self._active_devices[key] = hardware
+            except TypeError:
+                pass  # Not weak-referenceable; skip caching
+        return hardware
+
     def _hook_qnode_call(self, qml: Any) -> None:
         """Hook QNode execution."""
         try:
@@ -192,19 +255,31 @@ class PennyLaneAdapter(Adapter):
 
             @functools.wraps(original_call)
             def wrapped_call(self_qnode: Any, *args: Any, **kwargs: Any) -> Any:
-                builder = adapter.session.current_builder
+                session = adapter.session
+                if session.paused:
+                    return original_call(self_qnode, *args, **kwargs)
+
+                builder = session.current_builder
 
-                # Capture device info
+                # Device info and shots are resolved once per QNode and
+                # cached on it; re-resolve only if its device is swapped
                 device = self_qnode.device
-                hardware = _extract_device_info(device)
+                cached = getattr(self_qnode, "_qbom_hw", None)
+                if cached is None or cached[0] is not device:
+                    cached = (device, adapter._device_info(device), _resolve_shots(device))
+                    try:
+                        self_qnode._qbom_hw = cached
+                    except AttributeError:
+                        pass
+                _, hardware, num_shots = cached
                 builder.set_hardware(hardware)
 
-                submitted_at = datetime.utcnow()
+                start_ns = time.perf_counter_ns()
 
                 # Execute original
                 result = original_call(self_qnode, *args, **kwargs)
 
-                completed_at = datetime.utcnow()
+                end_ns = time.perf_counter_ns()
 
                 # Try to extract circuit info from the tape
                 try:
@@ -217,20 +292,12 @@ class PennyLaneAdapter(Adapter):
                 except Exception:
                     pass
 
-                # Get shots from device
-                shots = getattr(device, "shots", None)
-                if isinstance(shots, int):
-                    num_shots = shots
-                elif shots is not None:
-                    num_shots = shots.total_shots if hasattr(shots, "total_shots") else 1
-                else:
-                    num_shots = 1
-
                 # Capture execution
                 execution = Execution(
                     shots=num_shots,
-                    submitted_at=submitted_at,
-                    completed_at=completed_at,
+                    submitted_at=session.timestamp(start_ns),
+                    completed_at=session.timestamp(end_ns),
+                    duration_ns=end_ns - start_ns,
                 )
                 builder.set_execution(execution)
 
@@ -248,7 +315,7 @@ class PennyLaneAdapter(Adapter):
                 builder.set_result(qbom_result)
 
                 # Finalize trace
-                adapter.session.finalize_trace()
+                session.finalize_trace()
 
                 return result
 
@@ -270,9 +337,11 @@ class PennyLaneAdapter(Adapter):
             @functools.wraps(original_device)
             def wrapped_device(name: str, *args: Any, **kwargs: Any) -> Any:
                 device = original_device(name, *args, **kwargs)
+                if adapter.session.paused:
+                    return device
 
                 # Store device info for later reference
-                adapter._active_devices[id(device)] = _extract_device_info(device)
+                adapter._device_info(device)
 
                 return device
 
@@ -297,33 +366,37 @@ class PennyLaneAdapter(Adapter):
                 *args: Any,
                 **kwargs: Any,
             ) -> Any:
-                builder = adapter.session.current_builder
+                session = adapter.session
+                if session.paused:
+                    return original_execute(tapes, device, *args, **kwargs)
+
+                builder = session.current_builder
 
                 # Capture device
-                hardware = _extract_device_info(device)
+                hardware = adapter._device_info(device)
                 builder.set_hardware(hardware)
 
-                # Capture circuits from tapes
-                if isinstance(tapes, (list, tuple)):
-                    for tape in tapes:
-                        try:
-                            circuit = _extract_circuit_info(tape)
-                            builder.add_circuit(circuit)
-                        except Exception:
-                            pass
-                else:
+                # Capture circuits from tapes; a batch may repeat the same tape,
+                # so extract each distinct tape once. At the minimal capture
+                # level only the first tape is extracted.
+                tape_list = tapes if isinstance(tapes, (list, tuple)) else (tapes,)
+                extracted: dict[int, Circuit] = {}
+                captured = tape_list[:1] if session.capture_level == "minimal" else tape_list
+                for tape in captured:
                     try:
-                        circuit = _extract_circuit_info(tapes)
+                        circuit = extracted.get(id(tape))
+                        if circuit is None:
+                            circuit = extracted[id(tape)] = _extract_circuit_info(tape)
                         builder.add_circuit(circuit)
                     except Exception:
                         pass
 
-                submitted_at = datetime.utcnow()
+                start_ns = time.perf_counter_ns()
 
                 # Execute original
                 result = original_execute(tapes, device, *args, **kwargs)
 
-                completed_at = datetime.utcnow()
+                end_ns = time.perf_counter_ns()
 
                 # Get shots
                 shots = getattr(device, "shots", None)
@@ -331,8 +404,9 @@ class PennyLaneAdapter(Adapter):
 
                 execution = Execution(
                     shots=num_shots,
-                    submitted_at=submitted_at,
-                    completed_at=completed_at,
+                    submitted_at=session.timestamp(start_ns),
+                    completed_at=session.timestamp(end_ns),
+                    duration_ns=end_ns - start_ns,
                 )
                 builder.set_execution(execution)
 
@@ -341,11 +415,11 @@ class PennyLaneAdapter(Adapter):
                 qbom_result = Result(
                     counts=Counts(raw={}, shots=num_shots),
                     hash=result_hash,
-                    metadata={"type": "batch_execution"},
+                    metadata={"type": "batch_execution", "num_tapes": len(tape_list)},
                 )
                 builder.set_result(qbom_result)
 
-                adapter.session.finalize_trace()
+                session.finalize_trace()
 
                 return result
 
@@ -11,12 +11,16 @@ Captures Qiskit operations invisibly:
 from __future__ import annotations
 
 import functools
-import hashlib
+import sys
+import time
+import weakref
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from qbom.adapters.base import Adapter
+from qbom.core.hashing import hash_counts, new_hasher
 from qbom.core.models import (
     Calibration,
     Circuit,
@@ -35,46 +39,92 @@ if TYPE_CHECKING:
     from qbom.core.session import Session
 
 
-def _hash_circuit(circuit: Any) -> str:
-    """Compute deterministic hash of a Qiskit circuit."""
+# Common two-qubit gates
+_TWO_QUBIT_GATES = frozenset({"cx", "cz", "cy", "swap", "iswap", "ecr", "rzz", "rxx", "ryy"})
+
+# Instructions that are not counted as gates
+_NON_GATE_OPS = frozenset({"measure", "barrier", "reset"})
+
+
+def _circuit_qasm(circuit: Any) -> str | None:
+    """Serialize a circuit to OpenQASM 2 (None if it can't be expressed)."""
     try:
-        # Use QASM for hashing if available
-        qasm = circuit.qasm()
-        return hashlib.sha256(qasm.encode()).hexdigest()[:16]
+        from qiskit import qasm2
+
+        return qasm2.dumps(circuit)
+    except ImportError:
+        pass  # Qiskit < 1.0
     except Exception:
-        # Fallback to gate sequence
-        ops = str(circuit.data)
-        return hashlib.sha256(ops.encode()).hexdigest()[:16]
+        return None
+
+    try:
+        return circuit.qasm()
+    except Exception:
+        return None
 
 
-def _circuit_to_model(circuit: Any, name: str | None = None) -> Circuit:
-    """Convert Qiskit QuantumCircuit to QBOM Circuit model."""
-    gate_counts = circuit.count_ops()
+def _hash_params(h: Any, params: list[Any]) -> None:
+    """
+    Feed an operation's parameters to a hasher.
 
-    # Classify gates
+    Array parameters (e.g. unitary matrices) are hashed by dtype, shape and
+    raw bytes, since numpy abbreviates the repr of large arrays; scalars and
+    expressions are hashed by repr.
+    """
+    if not any(getattr(param, "ndim", 0) for param in params):
+        h.update(repr(params).encode())
+        return
+    for param in params:
+        if getattr(param, "ndim", 0):
+            h.update(f"{param.dtype.str}{param.shape}".encode())
+            h.update(param.tobytes())
+        else:
+            h.update(repr(param).encode())
+        h.update(b",")
+
+
+def _circuit_to_model(circuit: Any, name: str | None = None, full_qasm: bool = False) -> Circuit:
+    """
+    Convert Qiskit QuantumCircuit to QBOM Circuit model.
+
+    QASM is included for circuits of up to 20 qubits, or always with full_qasm.
+    """
+    # Count and classify gates in a single pass
+    gate_counts: dict[str, int] = {}
     single_qubit = 0
     two_qubit = 0
-    for gate, count in gate_counts.items():
-        # Common two-qubit gates
-        if gate in ("cx", "cz", "cy", "swap", "iswap", "ecr", "rzz", "rxx", "ryy"):
-            two_qubit += count
-        elif gate not in ("measure", "barrier", "reset"):
-            single_qubit += count
-
-    gates = GateCounts(
+    total = 0
+    find_bit = circuit.find_bit
+    h = new_hasher()
+    for instruction in circuit.data:
+        operation = instruction.operation
+        gate = sys.intern(operation.name)  # One key object per gate name across circuits
+        gate_counts[gate] = gate_counts.get(gate, 0) + 1
+        total += 1
+        if gate in _TWO_QUBIT_GATES:
+            two_qubit += 1
+        elif gate not in _NON_GATE_OPS:
+            single_qubit += 1
+
+        # Hash the instruction as we go (name, parameters, bit indices)
+        h.update(gate.encode())
+        if operation.params:
+            _hash_params(h, operation.params)
+        for bit in instruction.qubits:
+            h.update(b"q%d" % find_bit(bit).index)
+        for bit in instruction.clbits:
+            h.update(b"c%d" % find_bit(bit).index)
+        h.update(b";")
+
+    gates = GateCounts.shared(
+        gate_counts,
         single_qubit=single_qubit,
         two_qubit=two_qubit,
-        total=sum(gate_counts.values()),
-        by_name=dict(gate_counts),
+        total=total,
     )
 
     # Get QASM if circuit is small enough
-    qasm = None
-    if circuit.num_qubits <= 20:
-        try:
-            qasm = circuit.qasm()
-        except Exception:
-            pass
+    qasm = _circuit_qasm(circuit) if full_qasm or circuit.num_qubits <= 20 else None
 
     return Circuit(
         name=name or circuit.name or None,
@@ -82,7 +132,7 @@ def _circuit_to_model(circuit: Any, name: str | None = None) -> Circuit:
         num_clbits=circuit.num_clbits,
         depth=circuit.depth(),
         gates=gates,
-        hash=_hash_circuit(circuit),
+        hash=h.hexdigest(),
         qasm=qasm,
     )
 
@@ -96,7 +146,11 @@ def _extract_layout(layout: Any) -> QubitMapping | None:
         # Handle different Qiskit layout formats
         if hasattr(layout, "get_virtual_bits"):
             virtual_bits = layout.get_virtual_bits()
-            mapping = {v._index: k for k, v in virtual_bits.items() if hasattr(v, "_index")}
+            mapping = {}
+            for physical, virtual in virtual_bits.items():
+                index = getattr(virtual, "_index", None)
+                if index is not None:
+                    mapping[index] = physical
             if mapping:
                 return QubitMapping(logical_to_physical=mapping)
         elif hasattr(layout, "input_qubit_mapping"):
@@ -116,17 +170,25 @@ def _capture_calibration(backend: Any) -> Calibration | None:
 
         timestamp = props.last_update_date or datetime.utcnow()
 
-        # Capture qubit properties
+        # Capture qubit properties. qubit_property(i) returns every property
+        # of a qubit at once ({name: (value, date)}), so each qubit costs one
+        # lookup; a qubit with missing properties is skipped, not the whole
+        # calibration.
+        qubit_property = props.qubit_property
         qubits = []
         for i in range(backend.num_qubits):
             try:
+                qprops = qubit_property(i)
+                t1 = qprops["T1"][0]
+                t2 = qprops["T2"][0]
+                frequency = qprops["frequency"][0]
                 qubits.append(
                     QubitProperties(
                         index=i,
-                        t1_us=props.t1(i) * 1e6 if props.t1(i) else None,
-                        t2_us=props.t2(i) * 1e6 if props.t2(i) else None,
-                        readout_error=props.readout_error(i),
-                        frequency_ghz=props.frequency(i) / 1e9 if props.frequency(i) else None,
+                        t1_us=t1 * 1e6 if t1 else None,
+                        t2_us=t2 * 1e6 if t2 else None,
+                        readout_error=qprops["readout_error"][0],
+                        frequency_ghz=frequency / 1e9 if frequency else None,
                     )
                 )
             except Exception:
@@ -165,6 +227,32 @@ def _capture_calibration(backend: Any) -> Calibration | None:
         return None
 
 
+@dataclass(slots=True)
+class _PendingJob:
+    """What run() knew about a job, held until its result is captured."""
+
+    submitted_ns: int
+    shots: int
+    backend_ref: weakref.ref | None = None  # Don't keep the backend alive
+
+
+class _JobResultWrapper:
+    """Replacement for job.result() that captures the result it returns."""
+
+    __slots__ = ("adapter", "job", "job_id", "original")
+
+    def __init__(self, adapter: QiskitAdapter, job: Any, job_id: str, original: Callable) -> None:
+        self.adapter = adapter
+        self.job = job
+        self.job_id = job_id
+        self.original = original
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        result = self.original(*args, **kwargs)
+        self.adapter._capture_result(self.job, result, self.job_id)
+        return result
+
+
 class QiskitAdapter(Adapter):
     """
     Qiskit framework adapter.
@@ -179,15 +267,18 @@ class QiskitAdapter(Adapter):
 
     def __init__(self, session: Session) -> None:
         super().__init__(session)
-        self._pending_job_data: dict[str, dict[str, Any]] = {}
+        self._pending_job_data: dict[str, _PendingJob] = {}
+        # id(circuit) -> (content snapshot, model); evicted on GC
+        self._circuit_models: dict[int, tuple[tuple, Circuit]] = {}
 
     def install(self) -> None:
         """Install Qiskit hooks."""
         try:
             import qiskit
 
-            # Hook transpile (only once)
-            if not self._installed:
+            # Hook transpile (only once; install() can re-enter before
+            # _installed is set, when hooking run() imports qiskit_aer)
+            if "qiskit.transpile" not in self._original_functions:
                 self._wrap_function(qiskit, "transpile", self._make_transpile_wrapper)
 
             # Always try to hook backend run - new backends may have been imported
@@ -197,19 +288,54 @@ class QiskitAdapter(Adapter):
         except ImportError:
             pass  # Qiskit not installed
 
+    def _circuit_model(self, circuit: Any, name: str | None = None) -> Circuit:
+        """
+        Model a circuit, reusing the previous model while it is unchanged.
+
+        The same circuit object typically flows through several hooks
+        (transpile input, transpilation record, backend.run), so it is only
+        walked and hashed once. The cached model is reused only while the
+        circuit's instructions compare equal to a snapshot taken when it was
+        modeled, so in-place edits (replaced operations, bound parameters)
+        are picked up; the comparison is far cheaper than re-hashing and
+        regenerating QASM.
+        """
+        full_qasm = self.session.capture_level == "full"
+        signature = (full_qasm, circuit.name, circuit.num_qubits, circuit.num_clbits, tuple(circuit.data))
+        key = id(circuit)
+        cached = self._circuit_models.get(key)
+        if cached is not None and cached[0] == signature:
+            model = cached[1]
+        else:
+            model = _circuit_to_model(circuit, full_qasm=full_qasm)
+            try:
+                if cached is None:
+                    weakref.finalize(circuit, self._circuit_models.pop, key, None)
+                self._circuit_models[key] = (signature, model)
+            except TypeError:
+                pass  # Not weak-referenceable; skip caching
+
+        if name and name != model.name:
+            model = model.model_copy(update={"name": name})
+        return model
+
     def _make_transpile_wrapper(self, original: Callable) -> Callable:
         """Create wrapper for qiskit.transpile()."""
 
         @functools.wraps(original)
         def wrapper(circuits: Any, backend: Any = None, **kwargs: Any) -> Any:
+            session = self.session
+            if session.paused:
+                return original(circuits, backend, **kwargs)
+
             # Capture input
-            builder = self.session.current_builder
+            builder = session.current_builder
             is_list = isinstance(circuits, list)
             input_circuits = circuits if is_list else [circuits]
 
             # Capture input circuits
             for qc in input_circuits:
-                builder.add_circuit(_circuit_to_model(qc, "input"))
+                builder.add_circuit(self._circuit_model(qc, "input"))
 
             # Call original
             result = original(circuits, backend, **kwargs)
@@ -227,8 +353,8 @@ class QiskitAdapter(Adapter):
                 routing_method=kwargs.get("routing_method"),
                 initial_layout=_extract_layout(kwargs.get("initial_layout")),
                 final_layout=_extract_layout(getattr(output, "_layout", None)) if output else None,
-                input_circuit=_circuit_to_model(input_circuits[0]) if input_circuits else None,
-                output_circuit=_circuit_to_model(output) if output else None,
+                input_circuit=self._circuit_model(input_circuits[0]) if input_circuits else None,
+                output_circuit=self._circuit_model(output) if output else None,
             )
             builder.set_transpilation(transpilation)
 
@@ -284,6 +410,9 @@ class QiskitAdapter(Adapter):
 
             @functools.wraps(original_run)
             def wrapped_run(self_backend: Any, *args: Any, **kwargs: Any) -> Any:
+                if adapter.session.paused:
+                    return original_run(self_backend, *args, **kwargs)
+
                 # Capture circuit if passed as first arg
                 circuits = args[0] if args else kwargs.get("circuits")
                 if circuits is not None:
@@ -300,22 +429,16 @@ class QiskitAdapter(Adapter):
                 except Exception:
                     job_id = str(id(job))
 
-                adapter._pending_job_data[job_id] = {
-                    "submitted_at": datetime.utcnow(),
-                    "shots": kwargs.get("shots", 4096),
-                    "backend": self_backend,
-                }
+                try:
+                    backend_ref = weakref.ref(self_backend)
+                except TypeError:
+                    backend_ref = None
+                adapter._pending_job_data[job_id] = _PendingJob(
+                    time.perf_counter_ns(), kwargs.get("shots", 4096), backend_ref
+                )
 
                 # Hook job.result()
-                original_result = job.result
-
-                @functools.wraps(original_result)
-                def wrapped_result(*result_args: Any, **result_kwargs: Any) -> Any:
-                    result = original_result(*result_args, **result_kwargs)
-                    adapter._capture_result(job, result, job_id)
-                    return result
-
-                job.result = wrapped_result
+                job.result = _JobResultWrapper(adapter, job, job_id, job.result)
 
                 return job
 
@@ -354,7 +477,7 @@ class QiskitAdapter(Adapter):
 
         for qc in circuit_list:
             try:
-                builder.add_circuit(_circuit_to_model(qc))
+                builder.add_circuit(self._circuit_model(qc))
             except Exception:
                 pass  # Silently continue
 
@@ -371,7 +494,8 @@ class QiskitAdapter(Adapter):
 
     def _capture_result(self, job: Any, result: Any, job_id: str | None = None) -> None:
         """Capture job result."""
-        builder = self.session.current_builder
+        session = self.session
+        builder = session.current_builder
 
         if job_id is None:
             try:
@@ -380,14 +504,16 @@ class QiskitAdapter(Adapter):
                 job_id = str(id(job))
 
         # Get stored job data
-        job_data = self._pending_job_data.pop(job_id, {})
+        pending = self._pending_job_data.pop(job_id, None)
+
+        # Hooks record monotonic readings; convert to datetimes only here
 
         # Capture execution info
         execution = Execution(
             job_id=job_id,
-            shots=job_data.get("shots", 4096),
-            submitted_at=job_data.get("submitted_at"),
-            completed_at=datetime.utcnow(),
+            shots=pending.shots if pending else 4096,
+            submitted_at=session.timestamp(pending.submitted_ns) if pending else None,
+            completed_at=session.timestamp(time.perf_counter_ns()),
         )
         builder.set_execution(execution)
 
@@ -402,7 +528,7 @@ class QiskitAdapter(Adapter):
                 shots = sum(counts_dict.values())
                 counts = Counts(raw=counts_dict, shots=shots)
 
-                result_hash = hashlib.sha256(str(sorted(counts_dict.items())).encode()).hexdigest()[:16]
+                result_hash = hash_counts(counts_dict)
 
                 qbom_result = Result(
                     counts=counts,
@@ -411,7 +537,7 @@ class QiskitAdapter(Adapter):
                 builder.set_result(qbom_result)
 
                 # Finalize the trace
-                self.session.finalize_trace()
+                session.finalize_trace()
 
         except Exception:
             pass
@@ -13,11 +13,13 @@ from qbom.analysis.drift import (
     GateDrift,
     QubitDrift,
     analyze_drift,
+    batch_analyze_drift,
     explain_result_difference,
 )
 from qbom.analysis.score import (
     ReproducibilityScore,
     ScoreComponent,
+    batch_compute_score,
     compute_score,
 )
 from qbom.analysis.validation import (
@@ -26,15 +28,18 @@ from qbom.analysis.validation import (
     ValidationResult,
     validate_for_publication,
     validate_trace,
+    validate_traces,
 )
 
 __all__ = [
     # Scoring
     "compute_score",
+    "batch_compute_score",
     "ReproducibilityScore",
     "ScoreComponent",
     # Drift analysis
     "analyze_drift",
+    "batch_analyze_drift",
     "explain_result_difference",
     "DriftAnalysis",
     "QubitDrift",
@@ -42,6 +47,7 @@ __all__ = [
     # Validation
     "validate_trace",
     "validate_for_publication",
+    "validate_traces",
     "ValidationResult",
     "ValidationIssue",
     "ValidationLevel",
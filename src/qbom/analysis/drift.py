@@ -15,16 +15,22 @@ This module helps researchers:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import bisect
+import math
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from itertools import repeat
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from qbom.core.models import Calibration
+    from qbom.core.models import Calibration, QubitProperties
     from qbom.core.trace import Trace
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QubitDrift:
     """Drift analysis for a single qubit."""
 
@@ -45,18 +51,33 @@ class QubitDrift:
     readout_current: float | None
     readout_change_percent: float | None
 
+    # Derived once; recommendations and display read these repeatedly
+    _significant: bool = field(init=False, repr=False, compare=False)
+    _summary: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        significant = any(
+            change is not None and abs(change) > 10
+            for change in (self.t1_change_percent, self.t2_change_percent, self.readout_change_percent)
+        )
+        object.__setattr__(self, "_significant", significant)
+
     @property
     def has_significant_drift(self) -> bool:
         """True if any metric changed by >10%."""
-        for change in [self.t1_change_percent, self.t2_change_percent, self.readout_change_percent]:
-            if change is not None and abs(change) > 10:
-                return True
-        return False
+        return self._significant
 
     @property
     def drift_summary(self) -> str:
         """Human-readable drift summary."""
-        if not self.has_significant_drift:
+        summary = self._summary
+        if summary is None:
+            summary = self._build_summary()
+            object.__setattr__(self, "_summary", summary)
+        return summary
+
+    def _build_summary(self) -> str:
+        if not self._significant:
             return "Stable"
 
         changes = []
@@ -73,7 +94,7 @@ class QubitDrift:
         return ", ".join(changes) if changes else "Minor changes"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GateDrift:
     """Drift analysis for a gate."""
 
@@ -84,15 +105,19 @@ class GateDrift:
     error_current: float | None
     error_change_percent: float | None
 
+    _significant: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        significant = self.error_change_percent is not None and abs(self.error_change_percent) > 15
+        object.__setattr__(self, "_significant", significant)
+
     @property
     def has_significant_drift(self) -> bool:
         """True if error changed by >15%."""
-        if self.error_change_percent is not None:
-            return abs(self.error_change_percent) > 15
-        return False
+        return self._significant
 
 
-@dataclass
+@dataclass(slots=True)
 class DriftAnalysis:
     """
     Complete calibration drift analysis.
@@ -124,9 +149,10 @@ class DriftAnalysis:
 
     def summary(self) -> str:
         """Human-readable summary."""
-        if self.time_elapsed:
-            days = self.time_elapsed.days
-            time_str = f"{days} days" if days > 0 else f"{self.time_elapsed.seconds // 3600} hours"
+        if self.time_elapsed is not None:
+            secs = int(self.time_elapsed.total_seconds())
+            days = secs // 86400
+            time_str = f"{days} days" if days > 0 else f"{secs // 3600} hours"
         else:
             time_str = "unknown time"
 
@@ -137,6 +163,65 @@ class DriftAnalysis:
         )
 
 
+# Overall drift below 10 -> "High", below 25 -> "Medium", ...
+_FEASIBILITY_THRESHOLDS = (10, 25, 50)
+_FEASIBILITY_LABELS = ("High", "Medium", "Low", "Very Low")
+
+
+def _percent_change(original: float | None, current: float | None) -> float | None:
+    """Percent change from original to current (None unless both are nonzero)."""
+    if original and current:
+        return ((current - original) / original) * 100
+    return None
+
+
+def _qubit_changes(
+    matched: list[tuple[QubitProperties, QubitProperties]],
+) -> tuple[list[tuple[float | None, float | None, float | None]], float, int]:
+    """
+    Percent changes of (T1, T2, readout error) for each (original, current) qubit pair.
+
+    Also returns the sum and count of the available changes, each capped at
+    100%, which feed the overall drift score.
+    """
+    try:
+        import numpy as np  # Optional dependency
+    except ImportError:
+        rows = [
+            (
+                _percent_change(orig.t1_us, curr.t1_us),
+                _percent_change(orig.t2_us, curr.t2_us),
+                _percent_change(orig.readout_error, curr.readout_error),
+            )
+            for orig, curr in matched
+        ]
+        capped = [min(abs(change), 100) for row in rows for change in row if change is not None]
+        return rows, sum(capped), len(capped)
+
+    if not matched:
+        return [], 0.0, 0
+
+    # One row per qubit: [t1 orig, t1 curr, t2 orig, t2 curr, readout orig, readout curr]
+    # (None becomes NaN)
+    values = np.array(
+        [
+            (orig.t1_us, curr.t1_us, orig.t2_us, curr.t2_us, orig.readout_error, curr.readout_error)
+            for orig, curr in matched
+        ],
+        dtype=np.float64,
+    )
+    original, current = values[:, 0::2], values[:, 1::2]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        changes = (current - original) / original * 100.0
+    # Match _percent_change: missing or zero values give no change
+    valid = (original != 0) & (current != 0) & ~np.isnan(original) & ~np.isnan(current)
+    changes[~valid] = np.nan
+
+    capped_total = float(np.minimum(np.abs(changes[valid]), 100.0).sum())
+    rows = [tuple(None if math.isnan(c) else c for c in row) for row in changes.tolist()]
+    return rows, capped_total, int(valid.sum())
+
+
 def analyze_drift(
     trace: Trace,
     current_calibration: Calibration | None = None,
@@ -178,7 +263,9 @@ def analyze_drift(
 
     # If no current calibration provided, show what we have
     if not current_calibration:
-        age = datetime.utcnow() - original_cal.timestamp
+        # Measured against the cached epoch time, which also works for
+        # timezone-aware calibration timestamps
+        age = timedelta(seconds=time.time() - original_cal.epoch_seconds)
         days_old = age.days
 
         if days_old > 7:
@@ -210,104 +297,90 @@ def analyze_drift(
     # Full comparison
     time_elapsed = current_calibration.timestamp - original_cal.timestamp
 
-    # Analyze qubit drift
-    qubit_drift = []
-    for orig_q in original_cal.qubits:
-        # Find matching current qubit
-        curr_q = None
-        for q in current_calibration.qubits:
-            if q.index == orig_q.index:
-                curr_q = q
-                break
-
-        if curr_q:
-            # Calculate changes
-            t1_change = None
-            if orig_q.t1_us and curr_q.t1_us:
-                t1_change = ((curr_q.t1_us - orig_q.t1_us) / orig_q.t1_us) * 100
-
-            t2_change = None
-            if orig_q.t2_us and curr_q.t2_us:
-                t2_change = ((curr_q.t2_us - orig_q.t2_us) / orig_q.t2_us) * 100
-
-            readout_change = None
-            if orig_q.readout_error and curr_q.readout_error:
-                readout_change = ((curr_q.readout_error - orig_q.readout_error) / orig_q.readout_error) * 100
-
-            qubit_drift.append(
-                QubitDrift(
-                    qubit_index=orig_q.index,
-                    t1_original=orig_q.t1_us,
-                    t1_current=curr_q.t1_us,
-                    t1_change_percent=t1_change,
-                    t2_original=orig_q.t2_us,
-                    t2_current=curr_q.t2_us,
-                    t2_change_percent=t2_change,
-                    readout_original=orig_q.readout_error,
-                    readout_current=curr_q.readout_error,
-                    readout_change_percent=readout_change,
-                )
-            )
+    # Same snapshot (checked by timestamp first, so differing calibrations
+    # rarely pay for the deep comparison): nothing can have drifted
+    if current_calibration is original_cal or (not time_elapsed and current_calibration == original_cal):
+        return DriftAnalysis(
+            original_calibration_time=original_cal.timestamp,
+            current_calibration_time=current_calibration.timestamp,
+            time_elapsed=time_elapsed,
+            qubit_drift=[],
+            gate_drift=[],
+            overall_drift_score=0.0,
+            reproduction_feasibility="High",
+            recommendations=["Calibration unchanged since the experiment ran"],
+            better_qubits=None,
+        )
+
+    # Index current calibration once (reversed so the first duplicate wins,
+    # as a linear search would)
+    current_qubits = {q.index: q for q in reversed(current_calibration.qubits)}
+    current_gates = {(g.gate, g.qubits): g for g in reversed(current_calibration.gates)}
+
+    # Match qubits by index
+    matched_qubits = [
+        (orig_q, current_qubits[orig_q.index]) for orig_q in original_cal.qubits if orig_q.index in current_qubits
+    ]
+
+    # Analyze qubit drift; the capped total and count seed the overall score
+    qubit_changes, drift_total, drift_count = _qubit_changes(matched_qubits)
+    qubit_drift = [
+        QubitDrift(
+            qubit_index=orig_q.index,
+            t1_original=orig_q.t1_us,
+            t1_current=curr_q.t1_us,
+            t1_change_percent=t1_change,
+            t2_original=orig_q.t2_us,
+            t2_current=curr_q.t2_us,
+            t2_change_percent=t2_change,
+            readout_original=orig_q.readout_error,
+            readout_current=curr_q.readout_error,
+            readout_change_percent=readout_change,
+        )
+        for (orig_q, curr_q), (t1_change, t2_change, readout_change) in zip(matched_qubits, qubit_changes)
+    ]
 
     # Analyze gate drift
     gate_drift = []
     for orig_g in original_cal.gates:
-        # Find matching current gate
-        for curr_g in current_calibration.gates:
-            if curr_g.gate == orig_g.gate and curr_g.qubits == orig_g.qubits:
-                error_change = None
-                if orig_g.error and curr_g.error:
-                    error_change = ((curr_g.error - orig_g.error) / orig_g.error) * 100
-
-                gate_drift.append(
-                    GateDrift(
-                        gate_name=orig_g.gate,
-                        qubits=orig_g.qubits,
-                        error_original=orig_g.error,
-                        error_current=curr_g.error,
-                        error_change_percent=error_change,
-                    )
+        curr_g = current_gates.get((orig_g.gate, orig_g.qubits))
+        if curr_g is not None:
+            gate_drift.append(
+                GateDrift(
+                    gate_name=orig_g.gate,
+                    qubits=orig_g.qubits,
+                    error_original=orig_g.error,
+                    error_current=curr_g.error,
+                    error_change_percent=_percent_change(orig_g.error, curr_g.error),
                 )
-                break
-
-    # Calculate overall drift score
-    drift_scores = []
-    for qd in qubit_drift:
-        for change in [qd.t1_change_percent, qd.t2_change_percent, qd.readout_change_percent]:
-            if change is not None:
-                drift_scores.append(min(abs(change), 100))
+            )
 
+    # Calculate overall drift score (mean of capped changes, accumulated in place)
     for gd in gate_drift:
         if gd.error_change_percent is not None:
-            drift_scores.append(min(abs(gd.error_change_percent), 100))
+            drift_total += min(abs(gd.error_change_percent), 100)
+            drift_count += 1
 
-    if drift_scores:
-        overall_drift = sum(drift_scores) / len(drift_scores)
+    if drift_count:
+        overall_drift = drift_total / drift_count
     else:
         overall_drift = 50  # Unknown
 
     # Determine feasibility
-    if overall_drift < 10:
-        feasibility = "High"
-    elif overall_drift < 25:
-        feasibility = "Medium"
-    elif overall_drift < 50:
-        feasibility = "Low"
-    else:
-        feasibility = "Very Low"
+    feasibility = _FEASIBILITY_LABELS[bisect.bisect(_FEASIBILITY_THRESHOLDS, overall_drift)]
 
     # Generate recommendations
     recommendations = []
 
-    significant_qubit_drift = [qd for qd in qubit_drift if qd.has_significant_drift]
-    if significant_qubit_drift:
-        affected = [str(qd.qubit_index) for qd in significant_qubit_drift]
-        recommendations.append(f"Significant drift on qubits: {', '.join(affected)}")
+    # Filter and format in one pass; join() is handed a list because it
+    # materializes a generator into one anyway
+    affected = ", ".join([str(qd.qubit_index) for qd in qubit_drift if qd.has_significant_drift])
+    if affected:
+        recommendations.append(f"Significant drift on qubits: {affected}")
 
-    significant_gate_drift = [gd for gd in gate_drift if gd.has_significant_drift]
-    if significant_gate_drift:
-        gates = [f"{gd.gate_name}{list(gd.qubits)}" for gd in significant_gate_drift]
-        recommendations.append(f"Gate errors changed significantly: {', '.join(gates)}")
+    gates = ", ".join([f"{gd.gate_name}{list(gd.qubits)}" for gd in gate_drift if gd.has_significant_drift])
+    if gates:
+        recommendations.append(f"Gate errors changed significantly: {gates}")
 
     if time_elapsed.days > 1:
         recommendations.append(f"Calibration is {time_elapsed.days} days old - expect variation")
@@ -328,6 +401,26 @@ def analyze_drift(
     )
 
 
+def batch_analyze_drift(
+    traces: Sequence[Trace],
+    current_calibration: Calibration | None = None,
+    workers: int | None = 1,
+) -> list[DriftAnalysis | None]:
+    """
+    Analyze drift for many traces against one calibration.
+
+    Results are in the same order as traces. By default (workers=1) analysis
+    runs inline: it is cheaper than pickling a trace to a worker process, so
+    a pool only pays off for very large batches. workers=None uses one
+    process per CPU.
+    """
+    if workers == 1:
+        return [analyze_drift(trace, current_calibration) for trace in traces]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_drift, traces, repeat(current_calibration), chunksize=32))
+
+
 def explain_result_difference(
     trace1: Trace,
     trace2: Trace,
@@ -338,44 +431,43 @@ def explain_result_difference(
     This is the "why is my reproduction different?" question.
     """
     explanations = []
+    h1, h2 = trace1.hardware, trace2.hardware
+    t1, t2 = trace1.transpilation, trace2.transpilation
+    e1, e2 = trace1.execution, trace2.execution
+    c1, c2 = trace1.circuits, trace2.circuits
 
     # Check backend differences
-    if trace1.hardware and trace2.hardware:
-        if trace1.hardware.backend != trace2.hardware.backend:
-            explanations.append(f"Different backends: {trace1.hardware.backend} vs {trace2.hardware.backend}")
+    if h1 and h2:
+        if h1.backend != h2.backend:
+            explanations.append(f"Different backends: {h1.backend} vs {h2.backend}")
 
-        if trace1.hardware.qubits_used != trace2.hardware.qubits_used:
-            explanations.append(
-                f"Different physical qubits: {trace1.hardware.qubits_used} vs {trace2.hardware.qubits_used}"
-            )
+        if h1.qubits_used != h2.qubits_used:
+            explanations.append(f"Different physical qubits: {h1.qubits_used} vs {h2.qubits_used}")
 
         # Calibration time difference
-        if trace1.hardware.calibration and trace2.hardware.calibration:
-            time_diff = abs(
-                (trace2.hardware.calibration.timestamp - trace1.hardware.calibration.timestamp).total_seconds()
-            )
+        cal1, cal2 = h1.calibration, h2.calibration
+        if cal1 and cal2:
+            time_diff = abs(cal2.epoch_seconds - cal1.epoch_seconds)
             if time_diff > 86400:  # More than 1 day
                 days = time_diff / 86400
                 explanations.append(f"Calibrations are {days:.1f} days apart - hardware drift likely")
 
     # Check transpilation differences
-    if trace1.transpilation and trace2.transpilation:
-        if trace1.transpilation.optimization_level != trace2.transpilation.optimization_level:
-            lvl1 = trace1.transpilation.optimization_level
-            lvl2 = trace2.transpilation.optimization_level
-            explanations.append(f"Different optimization levels: {lvl1} vs {lvl2}")
+    if t1 and t2:
+        if t1.optimization_level != t2.optimization_level:
+            explanations.append(f"Different optimization levels: {t1.optimization_level} vs {t2.optimization_level}")
 
-        if trace1.transpilation.final_layout != trace2.transpilation.final_layout:
+        if t1.final_layout != t2.final_layout:
             explanations.append("Different qubit mappings after transpilation")
 
     # Check execution differences
-    if trace1.execution and trace2.execution:
-        if trace1.execution.shots != trace2.execution.shots:
-            explanations.append(f"Different shot counts: {trace1.execution.shots} vs {trace2.execution.shots}")
+    if e1 and e2:
+        if e1.shots != e2.shots:
+            explanations.append(f"Different shot counts: {e1.shots} vs {e2.shots}")
 
     # Check circuit differences
-    if trace1.circuits and trace2.circuits:
-        if trace1.circuits[0].hash != trace2.circuits[0].hash:
+    if c1 and c2:
+        if c1[0].hash != c2[0].hash:
             explanations.append("Circuit definitions differ - not the same experiment")
 
     if not explanations:
@@ -20,6 +20,10 @@ This helps researchers understand:
 
 from __future__ import annotations
 
+import bisect
+import weakref
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -27,7 +31,7 @@ if TYPE_CHECKING:
     from qbom.core.trace import Trace
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoreComponent:
     """A single component of the reproducibility score."""
 
@@ -45,7 +49,7 @@ class ScoreComponent:
         return (self.earned_points / self.max_points) * 100
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReproducibilityScore:
     """
     Complete reproducibility score for a QBOM trace.
@@ -64,13 +68,16 @@ class ReproducibilityScore:
     - Hardware (25 points): Backend and calibration
     - Execution (10 points): Run parameters
     - Results (10 points): Output verification
+
+    Scores are immutable: compute_score caches and returns the same
+    instance for the same trace.
     """
 
     total_score: int
     max_score: int
     grade: str
-    components: list[ScoreComponent]
-    recommendations: list[str]
+    components: tuple[ScoreComponent, ...]
+    recommendations: tuple[str, ...]
 
     @property
     def percentage(self) -> float:
@@ -86,296 +93,286 @@ class ReproducibilityScore:
         return f"{self.total_score}/{self.max_score} ({self.grade})"
 
 
-def compute_score(trace: Trace) -> ReproducibilityScore:
-    """
-    Compute the reproducibility score for a trace.
+# Each scorer returns the points earned for its section, or None when the
+# section wasn't captured at all, and appends recommendations as it goes.
 
-    Returns a detailed breakdown of what's captured and what's missing.
-    """
-    components: list[ScoreComponent] = []
-    recommendations: list[str] = []
 
-    # =========================================================================
-    # ENVIRONMENT (20 points)
-    # =========================================================================
-    env_points = 0
-    env_max = 20
-
-    if trace.environment:
-        env = trace.environment
-        # Python version (5 points)
-        if env.python:
-            env_points += 5
-
-        # Quantum SDK detected (8 points)
-        if env.quantum_sdk:
-            env_points += 8
-        else:
-            recommendations.append("Install a quantum SDK (qiskit, cirq, pennylane) for better tracking")
-
-        # Multiple packages tracked (7 points)
-        if len(env.packages) >= 3:
-            env_points += 7
-        elif len(env.packages) >= 1:
-            env_points += 4
-        else:
-            recommendations.append("Package versions not captured - reproducibility limited")
-
-        status = "complete" if env_points >= 18 else "partial" if env_points > 0 else "missing"
-    else:
-        status = "missing"
+def _score_environment(trace: Trace, recommendations: list[str]) -> int | None:
+    env = trace.environment
+    if not env:
         recommendations.append("No environment captured - cannot reproduce software setup")
+        return None
 
-    components.append(
-        ScoreComponent(
-            name="Environment",
-            category="Software",
-            max_points=env_max,
-            earned_points=env_points,
-            status=status,
-            recommendation="Captures Python version and package dependencies" if status == "complete" else None,
-        )
-    )
-
-    # =========================================================================
-    # CIRCUIT (20 points)
-    # =========================================================================
-    circuit_points = 0
-    circuit_max = 20
-
-    if trace.circuits and len(trace.circuits) > 0:
-        c = trace.circuits[0]
+    points = 0
 
-        # Basic circuit info (8 points)
-        if c.num_qubits > 0 and c.depth > 0:
-            circuit_points += 8
+    # Python version (5 points)
+    if env.python:
+        points += 5
 
-        # Gate counts (5 points)
-        if c.gates and c.gates.total > 0:
-            circuit_points += 5
+    # Quantum SDK detected (8 points)
+    if env.quantum_sdk:
+        points += 8
+    else:
+        recommendations.append("Install a quantum SDK (qiskit, cirq, pennylane) for better tracking")
+
+    # Multiple packages tracked (7 points)
+    num_packages = len(env.packages)
+    if num_packages >= 3:
+        points += 7
+    elif num_packages >= 1:
+        points += 4
+    else:
+        recommendations.append("Package versions not captured - reproducibility limited")
 
-        # Circuit hash for verification (4 points)
-        if c.hash:
-            circuit_points += 4
+    return points
 
-        # QASM or JSON representation (3 points)
-        if c.qasm or c.json_repr:
-            circuit_points += 3
-        else:
-            recommendations.append("Consider storing QASM for exact circuit reproduction")
 
-        status = "complete" if circuit_points >= 18 else "partial" if circuit_points > 0 else "missing"
-    else:
-        status = "missing"
+def _score_circuit(trace: Trace, recommendations: list[str]) -> int | None:
+    if not trace.circuits:
         recommendations.append("No circuit captured - the core of your experiment is missing")
+        return None
 
-    components.append(
-        ScoreComponent(
-            name="Circuit",
-            category="Quantum Program",
-            max_points=circuit_max,
-            earned_points=circuit_points,
-            status=status,
-        )
-    )
+    c = trace.circuits[0]
+    points = 0
 
-    # =========================================================================
-    # TRANSPILATION (15 points)
-    # =========================================================================
-    transp_points = 0
-    transp_max = 15
+    # Basic circuit info (8 points)
+    if c.num_qubits > 0 and c.depth > 0:
+        points += 8
 
-    if trace.transpilation:
-        t = trace.transpilation
+    # Gate counts (5 points)
+    if c.gates and c.gates.total > 0:
+        points += 5
 
-        # Optimization level (4 points)
-        if t.optimization_level is not None:
-            transp_points += 4
+    # Circuit hash for verification (4 points)
+    if c.hash:
+        points += 4
 
-        # Layout/routing methods (4 points)
-        if t.layout_method or t.routing_method:
-            transp_points += 4
+    # QASM or JSON representation (3 points)
+    if c.qasm or c.json_repr:
+        points += 3
+    else:
+        recommendations.append("Consider storing QASM for exact circuit reproduction")
 
-        # Qubit mapping (4 points) - CRITICAL for reproduction
-        if t.final_layout:
-            transp_points += 4
-        else:
-            recommendations.append("Qubit mapping not captured - results depend on physical qubit assignment")
+    return points
 
-        # Before/after circuit comparison (3 points)
-        if t.input_circuit and t.output_circuit:
-            transp_points += 3
 
-        status = "complete" if transp_points >= 13 else "partial" if transp_points > 0 else "missing"
-    else:
-        status = "missing"
+def _score_transpilation(trace: Trace, recommendations: list[str]) -> int | None:
+    t = trace.transpilation
+    if not t:
         # Not always applicable (simulators don't transpile)
         if trace.hardware and not trace.hardware.is_simulator:
             recommendations.append("Transpilation not captured - critical for hardware experiments")
+        return None
 
-    components.append(
-        ScoreComponent(
-            name="Transpilation",
-            category="Circuit Compilation",
-            max_points=transp_max,
-            earned_points=transp_points,
-            status=status,
-        )
-    )
+    points = 0
 
-    # =========================================================================
-    # HARDWARE (25 points) - Most important for real hardware
-    # =========================================================================
-    hw_points = 0
-    hw_max = 25
-
-    if trace.hardware:
-        h = trace.hardware
-
-        # Backend identification (6 points)
-        if h.backend:
-            hw_points += 6
-
-        # Provider (3 points)
-        if h.provider:
-            hw_points += 3
-
-        # Qubits used (4 points)
-        if h.qubits_used and len(h.qubits_used) > 0:
-            hw_points += 4
-        elif not h.is_simulator:
-            recommendations.append("Physical qubits not recorded - critical for reproduction")
-
-        # Calibration data (12 points) - THE killer feature
-        if h.calibration:
-            cal = h.calibration
-            # Timestamp (3 points)
-            if cal.timestamp:
-                hw_points += 3
-
-            # Qubit properties (5 points)
-            if cal.qubits and len(cal.qubits) > 0:
-                hw_points += 5
-
-            # Gate errors (4 points)
-            if cal.gates and len(cal.gates) > 0:
-                hw_points += 4
-        elif not h.is_simulator:
-            recommendations.append(
-                "⚠️ No calibration snapshot - hardware state changes daily, "
-                "reproduction without this is nearly impossible"
-            )
+    # Optimization level (4 points)
+    if t.optimization_level is not None:
+        points += 4
 
-        status = "complete" if hw_points >= 22 else "partial" if hw_points > 0 else "missing"
+    # Layout/routing methods (4 points)
+    if t.layout_method or t.routing_method:
+        points += 4
+
+    # Qubit mapping (4 points) - CRITICAL for reproduction
+    if t.final_layout:
+        points += 4
     else:
-        status = "missing"
-        recommendations.append("No hardware information - cannot determine where experiment ran")
+        recommendations.append("Qubit mapping not captured - results depend on physical qubit assignment")
 
-    components.append(
-        ScoreComponent(
-            name="Hardware",
-            category="Backend & Calibration",
-            max_points=hw_max,
-            earned_points=hw_points,
-            status=status,
-        )
-    )
+    # Before/after circuit comparison (3 points)
+    if t.input_circuit and t.output_circuit:
+        points += 3
 
-    # =========================================================================
-    # EXECUTION (10 points)
-    # =========================================================================
-    exec_points = 0
-    exec_max = 10
+    return points
 
-    if trace.execution:
-        e = trace.execution
 
-        # Shots (5 points)
-        if e.shots and e.shots > 0:
-            exec_points += 5
+def _score_hardware(trace: Trace, recommendations: list[str]) -> int | None:
+    h = trace.hardware
+    if not h:
+        recommendations.append("No hardware information - cannot determine where experiment ran")
+        return None
+
+    points = 0
+
+    # Backend identification (6 points)
+    if h.backend:
+        points += 6
+
+    # Provider (3 points)
+    if h.provider:
+        points += 3
+
+    # Qubits used (4 points)
+    if h.qubits_used:
+        points += 4
+    elif not h.is_simulator:
+        recommendations.append("Physical qubits not recorded - critical for reproduction")
+
+    # Calibration data (12 points) - THE killer feature
+    cal = h.calibration
+    if cal:
+        # Timestamp (3 points)
+        if cal.timestamp:
+            points += 3
+
+        # Qubit properties (5 points)
+        if cal.qubits:
+            points += 5
+
+        # Gate errors (4 points)
+        if cal.gates:
+            points += 4
+    elif not h.is_simulator:
+        recommendations.append(
+            "⚠️ No calibration snapshot - hardware state changes daily, reproduction without this is nearly impossible"
+        )
 
-        # Job ID for traceability (2 points)
-        if e.job_id:
-            exec_points += 2
+    return points
 
-        # Timing info (3 points)
-        if e.submitted_at or e.completed_at:
-            exec_points += 3
 
-        status = "complete" if exec_points >= 8 else "partial" if exec_points > 0 else "missing"
-    else:
-        status = "missing"
+def _score_execution(trace: Trace, recommendations: list[str]) -> int | None:
+    e = trace.execution
+    if not e:
         recommendations.append("Execution parameters not captured")
+        return None
 
-    components.append(
-        ScoreComponent(
-            name="Execution",
-            category="Run Parameters",
-            max_points=exec_max,
-            earned_points=exec_points,
-            status=status,
-        )
-    )
+    points = 0
 
-    # =========================================================================
-    # RESULTS (10 points)
-    # =========================================================================
-    result_points = 0
-    result_max = 10
+    # Shots (5 points)
+    if e.shots and e.shots > 0:
+        points += 5
 
-    if trace.result:
-        r = trace.result
+    # Job ID for traceability (2 points)
+    if e.job_id:
+        points += 2
 
-        # Counts captured (5 points)
-        if r.counts and r.counts.raw:
-            result_points += 5
+    # Timing info (3 points)
+    if e.submitted_at or e.completed_at:
+        points += 3
 
-        # Result hash for verification (3 points)
-        if r.hash:
-            result_points += 3
+    return points
 
-        # Metadata (2 points)
-        if r.metadata:
-            result_points += 2
 
-        status = "complete" if result_points >= 8 else "partial" if result_points > 0 else "missing"
-    else:
-        status = "missing"
+def _score_results(trace: Trace, recommendations: list[str]) -> int | None:
+    r = trace.result
+    if not r:
         recommendations.append("No results captured - cannot verify reproduction")
+        return None
 
-    components.append(
-        ScoreComponent(
-            name="Results",
-            category="Output Verification",
-            max_points=result_max,
-            earned_points=result_points,
-            status=status,
+    points = 0
+
+    # Counts captured (5 points)
+    if r.counts and r.counts.raw:
+        points += 5
+
+    # Result hash for verification (3 points)
+    if r.hash:
+        points += 3
+
+    # Metadata (2 points)
+    if r.metadata:
+        points += 2
+
+    return points
+
+
+# (name, category, max points, points for "complete", scorer, note when complete)
+_COMPONENTS: tuple[tuple[str, str, int, int, Callable[[Trace, list[str]], int | None], str | None], ...] = (
+    ("Environment", "Software", 20, 18, _score_environment, "Captures Python version and package dependencies"),
+    ("Circuit", "Quantum Program", 20, 18, _score_circuit, None),
+    ("Transpilation", "Circuit Compilation", 15, 13, _score_transpilation, None),
+    ("Hardware", "Backend & Calibration", 25, 22, _score_hardware, None),
+    ("Execution", "Run Parameters", 10, 8, _score_execution, None),
+    ("Results", "Output Verification", 10, 8, _score_results, None),
+)
+
+
+# Indexed by (points > 0) + (points >= complete threshold)
+_STATUSES = ("missing", "partial", "complete")
+
+# Percentage of at least 25 -> "Poor", at least 50 -> "Fair", ...
+_GRADE_THRESHOLDS = (25, 50, 70, 90)
+_GRADE_LABELS = ("Critical", "Poor", "Fair", "Good", "Excellent")
+
+# Scores keyed by id(trace). Traces are immutable, so a score stays valid for
+# the trace's lifetime; entries are evicted when the trace is garbage collected.
+_SCORE_CACHE: dict[int, ReproducibilityScore] = {}
+
+
+def compute_score(trace: Trace) -> ReproducibilityScore:
+    """
+    Compute the reproducibility score for a trace.
+
+    Returns a detailed breakdown of what's captured and what's missing.
+    Scoring the same trace again returns the cached result.
+    """
+    score = _SCORE_CACHE.get(id(trace))
+    if score is None:
+        score = _compute_score(trace)
+        _remember(trace, score)
+    return score
+
+
+def batch_compute_score(traces: Sequence[Trace], workers: int | None = 1) -> list[ReproducibilityScore]:
+    """
+    Score many traces, optionally spreading the work over a process pool.
+
+    Traces already scored in this process are answered from the cache and
+    only the rest are sent to workers. By default (workers=1) scoring runs
+    inline, which beats pickling traces to worker processes for all but very
+    large batches; workers=None uses one process per CPU.
+    """
+    pending = [trace for trace in traces if id(trace) not in _SCORE_CACHE]
+    if pending and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for trace, score in zip(pending, pool.map(_compute_score, pending, chunksize=32)):
+                _remember(trace, score)
+    return [compute_score(trace) for trace in traces]
+
+
+def _remember(trace: Trace, score: ReproducibilityScore) -> None:
+    """Cache a score until the trace is garbage collected."""
+    key = id(trace)
+    try:
+        weakref.finalize(trace, _SCORE_CACHE.pop, key, None)
+        _SCORE_CACHE[key] = score
+    except TypeError:
+        pass  # Not weak-referenceable; skip caching
+
+
+def _compute_score(trace: Trace) -> ReproducibilityScore:
+    components: list[ScoreComponent] = []
+    recommendations: list[str] = []
+    total_score = 0
+    max_score = 0
+
+    for name, category, max_points, complete_at, scorer, complete_note in _COMPONENTS:
+        points = scorer(trace, recommendations) or 0
+        status = _STATUSES[(points > 0) + (points >= complete_at)]
+
+        components.append(
+            ScoreComponent(
+                name,
+                category,
+                max_points,
+                points,
+                status,
+                complete_note if status == "complete" else None,
+            )
         )
-    )
+        total_score += points
+        max_score += max_points
 
-    # =========================================================================
-    # COMPUTE FINAL SCORE
-    # =========================================================================
-    total_score = sum(c.earned_points for c in components)
-    max_score = sum(c.max_points for c in components)
     percentage = (total_score / max_score) * 100
 
     # Determine grade
-    if percentage >= 90:
-        grade = "Excellent"
-    elif percentage >= 70:
-        grade = "Good"
-    elif percentage >= 50:
-        grade = "Fair"
-    elif percentage >= 25:
-        grade = "Poor"
-    else:
-        grade = "Critical"
+    grade = _GRADE_LABELS[bisect.bisect(_GRADE_THRESHOLDS, percentage)]
 
     return ReproducibilityScore(
         total_score=total_score,
         max_score=max_score,
         grade=grade,
-        components=components,
-        recommendations=recommendations,
+        components=tuple(components),
+        recommendations=tuple(recommendations),
     )
@@ -10,7 +10,10 @@ before publication or sharing.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import weakref
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING
 
@@ -26,7 +29,14 @@ class ValidationLevel(Enum):
     INFO = "info"  # Nice to have - improves documentation
 
 
-@dataclass
+# Severity rank per level (higher is more severe), used to index per-level tables
+_RANKS = {ValidationLevel.INFO: 0, ValidationLevel.WARNING: 1, ValidationLevel.ERROR: 2}
+
+# Terminal icons, indexed by rank
+_ICONS = ("ℹ", "⚠", "✗")
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationIssue:
     """A single validation issue found in a trace."""
 
@@ -38,42 +48,280 @@ class ValidationIssue:
     @property
     def icon(self) -> str:
         """Terminal icon for the issue level."""
-        icons = {
-            ValidationLevel.ERROR: "✗",
-            ValidationLevel.WARNING: "⚠",
-            ValidationLevel.INFO: "ℹ",
-        }
-        return icons.get(self.level, "?")
+        return _ICONS[_RANKS[self.level]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
-    """Complete validation result for a trace."""
+    """Complete validation result for a trace (immutable, so it can be cached and shared)."""
 
     is_valid: bool  # No errors (warnings/info ok)
     is_complete: bool  # No errors or warnings
-    issues: list[ValidationIssue]
+    issues: tuple[ValidationIssue, ...]
     summary: str
-
-    @property
-    def error_count(self) -> int:
-        return sum(1 for i in self.issues if i.level == ValidationLevel.ERROR)
-
-    @property
-    def warning_count(self) -> int:
-        return sum(1 for i in self.issues if i.level == ValidationLevel.WARNING)
-
-    @property
-    def info_count(self) -> int:
-        return sum(1 for i in self.issues if i.level == ValidationLevel.INFO)
-
-
-def validate_trace(trace: Trace) -> ValidationResult:
+    error_count: int = field(init=False)
+    warning_count: int = field(init=False)
+    info_count: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Counted once from the issues, however the result was built
+        errors, warnings, info = _count_levels(self.issues)
+        object.__setattr__(self, "error_count", errors)
+        object.__setattr__(self, "warning_count", warnings)
+        object.__setattr__(self, "info_count", info)
+
+
+def _count_levels(issues: Sequence[ValidationIssue]) -> tuple[int, int, int]:
+    """Count (errors, warnings, info) in a single pass."""
+    counts = [0, 0, 0]
+    ranks = _RANKS
+    for issue in issues:
+        counts[ranks[issue.level]] += 1
+    info, warnings, errors = counts
+    return errors, warnings, info
+
+
+# Issue categories (also the group headings in `qbom validate`)
+_CAT_ENVIRONMENT = "Environment"
+_CAT_CIRCUIT = "Circuit"
+_CAT_TRANSPILATION = "Transpilation"
+_CAT_HARDWARE = "Hardware"
+_CAT_EXECUTION = "Execution"
+_CAT_RESULTS = "Results"
+_CAT_METADATA = "Metadata"
+
+# Every issue is a constant, so each is built once and shared by all results
+_NO_ENVIRONMENT = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_ENVIRONMENT,
+    message="No environment captured",
+    fix="Ensure QBOM is imported before running your experiment. QBOM automatically captures the Python environment.",
+)
+_NO_PYTHON_VERSION = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_ENVIRONMENT,
+    message="Python version not captured",
+    fix="This should be automatic. Check that QBOM initialized correctly.",
+)
+_NO_QUANTUM_SDK = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_ENVIRONMENT,
+    message="No quantum SDK detected",
+    fix="Install a quantum SDK (qiskit, cirq, pennylane) before running.",
+)
+_NO_PACKAGES = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_ENVIRONMENT,
+    message="No package versions captured",
+    fix="Package capture should be automatic. Verify QBOM installation.",
+)
+_FEW_PACKAGES = ValidationIssue(
+    level=ValidationLevel.INFO,
+    category=_CAT_ENVIRONMENT,
+    message="Few packages captured - environment may be incomplete",
+    fix="Consider capturing more dependencies for better reproducibility.",
+)
+_NO_CIRCUITS = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_CIRCUIT,
+    message="No circuits captured",
+    fix="Ensure your quantum circuit is defined before execution. "
+    "QBOM captures circuits during transpilation or execution.",
+)
+_ZERO_QUBITS = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_CIRCUIT,
+    message="Circuit has 0 qubits",
+    fix="Your circuit appears empty. Verify circuit construction.",
+)
+_NO_CIRCUIT_HASH = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_CIRCUIT,
+    message="Circuit hash not computed",
+    fix="Circuit verification requires a hash. Check circuit capture.",
+)
+_NO_CIRCUIT_REPR = ValidationIssue(
+    level=ValidationLevel.INFO,
+    category=_CAT_CIRCUIT,
+    message="No QASM or JSON representation stored",
+    fix="Consider storing QASM for exact circuit reproduction. Use trace.circuits[0].qasm = circuit.qasm() to capture.",
+)
+_NO_GATES = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_CIRCUIT,
+    message="Circuit has no gates",
+    fix="An empty circuit won't produce meaningful results.",
+)
+_NO_TRANSPILATION = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_TRANSPILATION,
+    message="No transpilation captured for hardware execution",
+    fix="Transpilation is critical for reproducibility. Use qiskit.transpile() or equivalent before execution.",
+)
+_NO_OPTIMIZATION_LEVEL = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_TRANSPILATION,
+    message="Optimization level not recorded",
+    fix="Specify optimization_level in transpile() call.",
+)
+_NO_FINAL_LAYOUT = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_TRANSPILATION,
+    message="Final qubit layout not captured",
+    fix="The physical qubit mapping is essential for reproduction. "
+    "Ensure transpilation output includes layout information.",
+)
+_NO_HARDWARE = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_HARDWARE,
+    message="No hardware information captured",
+    fix="Ensure you execute on a backend. QBOM captures hardware information during backend.run() or equivalent.",
+)
+_NO_BACKEND = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_HARDWARE,
+    message="Backend name not captured",
+    fix="Backend identification is required for reproduction.",
+)
+_NO_QUBITS_USED = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_HARDWARE,
+    message="Physical qubits not recorded",
+    fix="For real hardware, knowing which physical qubits were used is essential. Check transpilation output.",
+)
+_NO_CALIBRATION = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_HARDWARE,
+    message="No calibration snapshot captured",
+    fix="Calibration data is the most critical piece for "
+    "hardware reproducibility. Hardware properties change "
+    "daily. Without this, reproduction is nearly impossible.",
+)
+_NO_CALIBRATION_TIMESTAMP = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_HARDWARE,
+    message="Calibration timestamp missing",
+    fix="Record when calibration data was captured.",
+)
+_NO_QUBIT_PROPERTIES = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_HARDWARE,
+    message="No qubit properties in calibration",
+    fix="Capture T1, T2, and readout error for used qubits.",
+)
+_NO_GATE_ERRORS = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_HARDWARE,
+    message="No gate errors in calibration",
+    fix="Capture gate error rates for used gates.",
+)
+_NO_EXECUTION = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_EXECUTION,
+    message="No execution parameters captured",
+    fix="Execution parameters (shots, timing) help with reproduction.",
+)
+_NO_SHOTS = ValidationIssue(
+    level=ValidationLevel.ERROR,
+    category=_CAT_EXECUTION,
+    message="Shot count not recorded",
+    fix="The number of shots directly affects result statistics. Specify shots in your run() call.",
+)
+_NO_JOB_ID = ValidationIssue(
+    level=ValidationLevel.INFO,
+    category=_CAT_EXECUTION,
+    message="Job ID not captured",
+    fix="Job IDs enable traceability to cloud provider records.",
+)
+_NO_RESULTS = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_RESULTS,
+    message="No results captured",
+    fix="Results allow verification of reproduction attempts. Wait for job.result() before exporting the trace.",
+)
+_NO_COUNTS = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_RESULTS,
+    message="No measurement counts captured",
+    fix="Capture raw counts from job.result().get_counts().",
+)
+_NO_RESULT_HASH = ValidationIssue(
+    level=ValidationLevel.INFO,
+    category=_CAT_RESULTS,
+    message="Result hash not computed",
+    fix="Result hashes let reruns be checked against the captured counts.",
+)
+_NO_EXPERIMENT_NAME = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_METADATA,
+    message="Experiment name not set",
+    fix="Add a descriptive name for your experiment.",
+)
+_NO_DESCRIPTION = ValidationIssue(
+    level=ValidationLevel.INFO,
+    category=_CAT_METADATA,
+    message="No experiment description",
+    fix="Add a description explaining the experiment purpose.",
+)
+_NO_CIRCUIT_REPR_FOR_PUBLICATION = ValidationIssue(
+    level=ValidationLevel.WARNING,
+    category=_CAT_CIRCUIT,
+    message="No circuit representation for exact reproduction",
+    fix="Store QASM or JSON representation for publication. This allows others to recreate your exact circuit.",
+)
+
+
+# Summary templates keyed by (is_valid, is_complete, has info issues)
+_SUMMARIES = {
+    (True, True, False): "Trace is complete and ready for publication",
+    (True, True, True): "Trace is valid with {info} suggestion(s)",
+    (True, False, False): "Trace is valid but has {warnings} warning(s)",
+    (True, False, True): "Trace is valid but has {warnings} warning(s)",
+    (False, False, False): "Trace has {errors} error(s) that must be fixed",
+    (False, False, True): "Trace has {errors} error(s) that must be fixed",
+}
+
+# Publication summary templates keyed by (is_valid, is_complete)
+_PUBLICATION_SUMMARIES = {
+    (True, True): "Trace is ready for publication",
+    (True, False): "Trace has {warnings} warning(s) to address before publication",
+    (False, False): "Trace has {errors} error(s) that block publication",
+}
+
+# Results keyed by (id(trace), check). Traces are immutable, so a result stays
+# valid for the trace's lifetime; entries are evicted when it is garbage collected.
+_VALIDATION_CACHE: dict[tuple[int, str], ValidationResult] = {}
+
+
+def _cached(trace: Trace, check: str, validate: Callable[[Trace], ValidationResult]) -> ValidationResult:
+    """Run a validation check once per trace and reuse its result."""
+    key = (id(trace), check)
+    result = _VALIDATION_CACHE.get(key)
+    if result is None:
+        result = validate(trace)
+        _remember(trace, check, result)
+    return result
+
+
+def _remember(trace: Trace, check: str, result: ValidationResult) -> None:
+    """Cache a result until the trace is garbage collected."""
+    key = (id(trace), check)
+    try:
+        weakref.finalize(trace, _VALIDATION_CACHE.pop, key, None)
+        _VALIDATION_CACHE[key] = result
+    except TypeError:
+        pass  # Not weak-referenceable; skip caching
+
+
+def validate_trace(trace: Trace, *, fast_fail: bool = False) -> ValidationResult:
     """
     Validate a QBOM trace for completeness and correctness.
 
+    Validating the same trace again returns the cached result.
+
     Args:
         trace: The trace to validate
+        fast_fail: Stop at the first error, for callers that only need is_valid
 
     Returns:
         ValidationResult with all issues found and guidance
@@ -85,119 +333,77 @@ def validate_trace(trace: Trace) -> ValidationResult:
                 print(f"{issue.icon} {issue.message}")
                 print(f"  Fix: {issue.fix}")
     """
+    if fast_fail:
+        return _cached(trace, "fast_fail", lambda t: _validate_trace(t, fast_fail=True))
+    return _cached(trace, "trace", _validate_trace)
+
+
+def validate_traces(traces: Sequence[Trace], *, workers: int = 1) -> list[ValidationResult]:
+    """
+    Validate many traces, optionally spreading the work over a process pool.
+
+    Traces already validated in this process are answered from the cache and
+    only the rest are sent to workers. With workers=1 (the default),
+    validation runs inline.
+    """
+    pending = [trace for trace in traces if (id(trace), "trace") not in _VALIDATION_CACHE]
+    if pending and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for trace, result in zip(pending, pool.map(_validate_trace, pending, chunksize=32)):
+                _remember(trace, "trace", result)
+    return [validate_trace(trace) for trace in traces]
+
+
+def _validate_trace(trace: Trace, fast_fail: bool = False) -> ValidationResult:
     issues: list[ValidationIssue] = []
 
     # =========================================================================
     # ENVIRONMENT VALIDATION
     # =========================================================================
     if trace.environment is None:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.ERROR,
-                category="Environment",
-                message="No environment captured",
-                fix="Ensure QBOM is imported before running your experiment. "
-                "QBOM automatically captures the Python environment.",
-            )
-        )
+        issues.append(_NO_ENVIRONMENT)
+        if fast_fail:
+            return _build_result(issues)
     else:
         env = trace.environment
 
         if not env.python:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    category="Environment",
-                    message="Python version not captured",
-                    fix="This should be automatic. Check that QBOM initialized correctly.",
-                )
-            )
+            issues.append(_NO_PYTHON_VERSION)
+            if fast_fail:
+                return _build_result(issues)
 
         if not env.quantum_sdk:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    category="Environment",
-                    message="No quantum SDK detected",
-                    fix="Install a quantum SDK (qiskit, cirq, pennylane) before running.",
-                )
-            )
-
-        if len(env.packages) == 0:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    category="Environment",
-                    message="No package versions captured",
-                    fix="Package capture should be automatic. Verify QBOM installation.",
-                )
-            )
-        elif len(env.packages) < 3:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.INFO,
-                    category="Environment",
-                    message="Few packages captured - environment may be incomplete",
-                    fix="Consider capturing more dependencies for better reproducibility.",
-                )
-            )
+            issues.append(_NO_QUANTUM_SDK)
+
+        num_packages = len(env.packages)
+        if num_packages == 0:
+            issues.append(_NO_PACKAGES)
+        elif num_packages < 3:
+            issues.append(_FEW_PACKAGES)
 
     # =========================================================================
     # CIRCUIT VALIDATION
     # =========================================================================
-    if not trace.circuits or len(trace.circuits) == 0:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.ERROR,
-                category="Circuit",
-                message="No circuits captured",
-                fix="Ensure your quantum circuit is defined before execution. "
-                "QBOM captures circuits during transpilation or execution.",
-            )
-        )
+    if not trace.circuits:
+        issues.append(_NO_CIRCUITS)
+        if fast_fail:
+            return _build_result(issues)
     else:
         circuit = trace.circuits[0]
 
         if circuit.num_qubits == 0:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    category="Circuit",
-                    message="Circuit has 0 qubits",
-                    fix="Your circuit appears empty. Verify circuit construction.",
-                )
-            )
+            issues.append(_ZERO_QUBITS)
+            if fast_fail:
+                return _build_result(issues)
 
         if not circuit.hash:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    category="Circuit",
-                    message="Circuit hash not computed",
-                    fix="Circuit verification requires a hash. Check circuit capture.",
-                )
-            )
+            issues.append(_NO_CIRCUIT_HASH)
 
         if not circuit.qasm and not circuit.json_repr:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.INFO,
-                    category="Circuit",
-                    message="No QASM or JSON representation stored",
-                    fix="Consider storing QASM for exact circuit reproduction. "
-                    "Use trace.circuits[0].qasm = circuit.qasm() to capture.",
-                )
-            )
+            issues.append(_NO_CIRCUIT_REPR)
 
         if circuit.gates and circuit.gates.total == 0:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    category="Circuit",
-                    message="Circuit has no gates",
-                    fix="An empty circuit won't produce meaningful results.",
-                )
-            )
+            issues.append(_NO_GATES)
 
     # =========================================================================
     # TRANSPILATION VALIDATION
@@ -205,216 +411,105 @@ def validate_trace(trace: Trace) -> ValidationResult:
     if trace.hardware and not trace.hardware.is_simulator:
         # Transpilation is critical for real hardware
         if trace.transpilation is None:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    category="Transpilation",
-                    message="No transpilation captured for hardware execution",
-                    fix="Transpilation is critical for reproducibility. "
-                    "Use qiskit.transpile() or equivalent before execution.",
-                )
-            )
+            issues.append(_NO_TRANSPILATION)
+            if fast_fail:
+                return _build_result(issues)
         else:
             transp = trace.transpilation
 
             if transp.optimization_level is None:
-                issues.append(
-                    ValidationIssue(
-                        level=ValidationLevel.WARNING,
-                        category="Transpilation",
-                        message="Optimization level not recorded",
-                        fix="Specify optimization_level in transpile() call.",
-                    )
-                )
+                issues.append(_NO_OPTIMIZATION_LEVEL)
 
             if not transp.final_layout:
-                issues.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        category="Transpilation",
-                        message="Final qubit layout not captured",
-                        fix="The physical qubit mapping is essential for reproduction. "
-                        "Ensure transpilation output includes layout information.",
-                    )
-                )
+                issues.append(_NO_FINAL_LAYOUT)
+                if fast_fail:
+                    return _build_result(issues)
 
     # =========================================================================
     # HARDWARE VALIDATION
     # =========================================================================
     if trace.hardware is None:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.ERROR,
-                category="Hardware",
-                message="No hardware information captured",
-                fix="Ensure you execute on a backend. QBOM captures hardware "
-                "information during backend.run() or equivalent.",
-            )
-        )
+        issues.append(_NO_HARDWARE)
+        if fast_fail:
+            return _build_result(issues)
     else:
         hw = trace.hardware
 
         if not hw.backend:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    category="Hardware",
-                    message="Backend name not captured",
-                    fix="Backend identification is required for reproduction.",
-                )
-            )
+            issues.append(_NO_BACKEND)
+            if fast_fail:
+                return _build_result(issues)
 
         if not hw.is_simulator:
             # Real hardware requires additional information
-            if not hw.qubits_used or len(hw.qubits_used) == 0:
-                issues.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        category="Hardware",
-                        message="Physical qubits not recorded",
-                        fix="For real hardware, knowing which physical qubits "
-                        "were used is essential. Check transpilation output.",
-                    )
-                )
+            if not hw.qubits_used:
+                issues.append(_NO_QUBITS_USED)
+                if fast_fail:
+                    return _build_result(issues)
 
             if not hw.calibration:
-                issues.append(
-                    ValidationIssue(
-                        level=ValidationLevel.ERROR,
-                        category="Hardware",
-                        message="No calibration snapshot captured",
-                        fix="Calibration data is the most critical piece for "
-                        "hardware reproducibility. Hardware properties change "
-                        "daily. Without this, reproduction is nearly impossible.",
-                    )
-                )
+                issues.append(_NO_CALIBRATION)
+                if fast_fail:
+                    return _build_result(issues)
             else:
                 cal = hw.calibration
 
                 if not cal.timestamp:
-                    issues.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            category="Hardware",
-                            message="Calibration timestamp missing",
-                            fix="Record when calibration data was captured.",
-                        )
-                    )
-
-                if not cal.qubits or len(cal.qubits) == 0:
-                    issues.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            category="Hardware",
-                            message="No qubit properties in calibration",
-                            fix="Capture T1, T2, and readout error for used qubits.",
-                        )
-                    )
-
-                if not cal.gates or len(cal.gates) == 0:
-                    issues.append(
-                        ValidationIssue(
-                            level=ValidationLevel.WARNING,
-                            category="Hardware",
-                            message="No gate errors in calibration",
-                            fix="Capture gate error rates for used gates.",
-                        )
-                    )
+                    issues.append(_NO_CALIBRATION_TIMESTAMP)
+
+                if not cal.qubits:
+                    issues.append(_NO_QUBIT_PROPERTIES)
+
+                if not cal.gates:
+                    issues.append(_NO_GATE_ERRORS)
 
     # =========================================================================
     # EXECUTION VALIDATION
     # =========================================================================
     if trace.execution is None:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.WARNING,
-                category="Execution",
-                message="No execution parameters captured",
-                fix="Execution parameters (shots, timing) help with reproduction.",
-            )
-        )
+        issues.append(_NO_EXECUTION)
     else:
         exe = trace.execution
 
         if not exe.shots or exe.shots == 0:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.ERROR,
-                    category="Execution",
-                    message="Shot count not recorded",
-                    fix="The number of shots directly affects result statistics. Specify shots in your run() call.",
-                )
-            )
+            issues.append(_NO_SHOTS)
+            if fast_fail:
+                return _build_result(issues)
 
         if not exe.job_id:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.INFO,
-                    category="Execution",
-                    message="Job ID not captured",
-                    fix="Job IDs enable traceability to cloud provider records.",
-                )
-            )
+            issues.append(_NO_JOB_ID)
 
     # =========================================================================
     # RESULT VALIDATION
     # =========================================================================
     if trace.result is None:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.WARNING,
-                category="Results",
-                message="No results captured",
-                fix="Results allow verification of reproduction attempts. "
-                "Wait for job.result() before exporting the trace.",
-            )
-        )
+        issues.append(_NO_RESULTS)
     else:
         res = trace.result
 
         if not res.counts or not res.counts.raw:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    category="Results",
-                    message="No measurement counts captured",
-                    fix="Capture raw counts from job.result().get_counts().",
-                )
-            )
+            issues.append(_NO_COUNTS)
 
         if not res.hash:
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.INFO,
-                    category="Results",
-                    message="Result hash not computed",
-                    fix="Result hashes enable tamper detection.",
-                )
-            )
+            issues.append(_NO_RESULT_HASH)
+
+    return _build_result(issues)
 
-    # =========================================================================
-    # COMPUTE SUMMARY
-    # =========================================================================
-    error_count = sum(1 for i in issues if i.level == ValidationLevel.ERROR)
-    warning_count = sum(1 for i in issues if i.level == ValidationLevel.WARNING)
-    info_count = sum(1 for i in issues if i.level == ValidationLevel.INFO)
+
+def _build_result(issues: list[ValidationIssue]) -> ValidationResult:
+    """Summarize the issues found by validate_trace."""
+    error_count, warning_count, info_count = _count_levels(issues)
 
     is_valid = error_count == 0
     is_complete = error_count == 0 and warning_count == 0
 
-    if is_complete and info_count == 0:
-        summary = "Trace is complete and ready for publication"
-    elif is_complete:
-        summary = f"Trace is valid with {info_count} suggestion(s)"
-    elif is_valid:
-        summary = f"Trace is valid but has {warning_count} warning(s)"
-    else:
-        summary = f"Trace has {error_count} error(s) that must be fixed"
+    template = _SUMMARIES[is_valid, is_complete, info_count > 0]
+    summary = template.format(errors=error_count, warnings=warning_count, info=info_count)
 
     return ValidationResult(
         is_valid=is_valid,
         is_complete=is_complete,
-        issues=issues,
+        issues=tuple(issues),
         summary=summary,
     )
 
@@ -434,62 +529,44 @@ def validate_for_publication(trace: Trace) -> ValidationResult:
     Returns:
         ValidationResult with publication-specific checks
     """
+    return _cached(trace, "publication", _validate_for_publication)
+
+
+def _validate_for_publication(trace: Trace) -> ValidationResult:
     result = validate_trace(trace)
     issues = list(result.issues)
+    error_count = result.error_count
+    warning_count = result.warning_count
+    info_count = result.info_count
 
     # Additional publication requirements
     if not trace.metadata.name:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.WARNING,
-                category="Metadata",
-                message="Experiment name not set",
-                fix="Add a descriptive name for your experiment.",
-            )
-        )
+        issues.append(_NO_EXPERIMENT_NAME)
+        warning_count += 1
 
     if not trace.metadata.description:
-        issues.append(
-            ValidationIssue(
-                level=ValidationLevel.INFO,
-                category="Metadata",
-                message="No experiment description",
-                fix="Add a description explaining the experiment purpose.",
-            )
-        )
+        issues.append(_NO_DESCRIPTION)
+        info_count += 1
 
     if trace.circuits and trace.circuits[0]:
         circuit = trace.circuits[0]
         if not circuit.qasm and not circuit.json_repr:
-            # Upgrade from INFO to WARNING for publication
-            issues = [i for i in issues if not (i.category == "Circuit" and "QASM" in i.message)]
-            issues.append(
-                ValidationIssue(
-                    level=ValidationLevel.WARNING,
-                    category="Circuit",
-                    message="No circuit representation for exact reproduction",
-                    fix="Store QASM or JSON representation for publication. "
-                    "This allows others to recreate your exact circuit.",
-                )
-            )
-
-    # Recompute summary
-    error_count = sum(1 for i in issues if i.level == ValidationLevel.ERROR)
-    warning_count = sum(1 for i in issues if i.level == ValidationLevel.WARNING)
+            # Upgrade from INFO to WARNING for publication; validate_trace
+            # reported the INFO issue under the same condition
+            issues.remove(_NO_CIRCUIT_REPR)
+            issues.append(_NO_CIRCUIT_REPR_FOR_PUBLICATION)
+            info_count -= 1
+            warning_count += 1
 
     is_valid = error_count == 0
     is_complete = error_count == 0 and warning_count == 0
 
-    if is_complete:
-        summary = "Trace is ready for publication"
-    elif is_valid:
-        summary = f"Trace has {warning_count} warning(s) to address before publication"
-    else:
-        summary = f"Trace has {error_count} error(s) that block publication"
+    template = _PUBLICATION_SUMMARIES[is_valid, is_complete]
+    summary = template.format(errors=error_count, warnings=warning_count)
 
     return ValidationResult(
         is_valid=is_valid,
         is_complete=is_complete,
-        issues=issues,
+        issues=tuple(issues),
         summary=summary,
     )
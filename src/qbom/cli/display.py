@@ -6,11 +6,15 @@ Beautiful terminal output using Rich.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import weakref
+from collections.abc import Callable
+from itertools import islice
+from typing import TYPE_CHECKING, TypeVar
 
 from rich import box
 from rich.console import Console
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -19,51 +23,105 @@ if TYPE_CHECKING:
 
 console = Console()
 
+_T = TypeVar("_T")
+
+# Styles are built once rather than parsed from strings on every render
+_BOLD = Style(bold=True)
+_BOLD_CYAN = Style(color="cyan", bold=True)
+_CYAN = Style(color="cyan")
+_DIM = Style(dim=True)
+_WHITE = Style(color="white")
+_MATCH = Text("✓", style=Style(color="green"))
+_MISMATCH = Text("✗", style=Style(color="red"))
+_PASS_MARK = "  [green]✓[/green] "
+_FAIL_MARK = "  [red]✗[/red] "
+
+# Rendered table rows and panel bodies keyed by id(trace). Traces are immutable,
+# so the text stays valid for the trace's lifetime; entries are evicted when
+# the trace is garbage collected.
+_TRACE_ROWS: dict[int, tuple[str, str, str, str, str]] = {}
+_TRACE_BODIES: dict[int, str] = {}
+
+
+def _rendered(cache: dict[int, _T], trace: Trace, render: Callable[[Trace], _T]) -> _T:
+    """Render a trace once and reuse the output on later displays."""
+    key = id(trace)
+    rendered = cache.get(key)
+    if rendered is None:
+        rendered = render(trace)
+        try:
+            weakref.finalize(trace, cache.pop, key, None)
+            cache[key] = rendered
+        except TypeError:
+            pass  # Not weak-referenceable; skip caching
+    return rendered
+
 
 def display_trace_list(traces: list[Trace]) -> None:
     """Display a list of traces in a beautiful table."""
     table = Table(
         title="Recent QBOM Traces",
         box=box.ROUNDED,
-        header_style="bold cyan",
-        title_style="bold",
+        header_style=_BOLD_CYAN,
+        title_style=_BOLD,
     )
 
-    table.add_column("ID", style="dim")
-    table.add_column("Created", style="dim")
+    table.add_column("ID", style=_DIM)
+    table.add_column("Created", style=_DIM)
     table.add_column("Backend")
     table.add_column("Circuit")
     table.add_column("Shots", justify="right")
 
+    add_row = table.add_row
     for trace in traces:
-        # Format time
-        time_str = trace.created_at.strftime("%Y-%m-%d %H:%M")
+        add_row(*_rendered(_TRACE_ROWS, trace, _trace_row))
 
-        # Backend
-        backend = trace.hardware.backend if trace.hardware else "-"
+    console.print(table)
 
-        # Circuit summary
-        if trace.circuits:
-            c = trace.circuits[0]
-            circuit = f"{c.num_qubits}q, d={c.depth}"
-        else:
-            circuit = "-"
 
-        # Shots
-        shots = f"{trace.execution.shots:,}" if trace.execution else "-"
+def _trace_row(trace: Trace) -> tuple[str, str, str, str, str]:
+    """Table cells for one trace in display_trace_list."""
+    hardware = trace.hardware
+    circuits = trace.circuits
+    execution = trace.execution
 
-        table.add_row(trace.id, time_str, backend, circuit, shots)
+    # Format time
+    time_str = trace.created_at.strftime("%Y-%m-%d %H:%M")
 
-    console.print(table)
+    # Backend
+    backend = hardware.backend if hardware else "-"
+
+    # Circuit summary
+    if circuits:
+        c = circuits[0]
+        circuit = f"{c.num_qubits}q, d={c.depth}"
+    else:
+        circuit = "-"
+
+    # Shots
+    shots = format(execution.shots, ",") if execution else "-"
+
+    return trace.id, time_str, backend, circuit, shots
 
 
 def display_trace(trace: Trace) -> None:
     """Display a single trace with full details."""
     # Header
     header = Text()
-    header.append("QBOM: ", style="bold cyan")
-    header.append(trace.id, style="bold")
+    header.append("QBOM: ", style=_BOLD_CYAN)
+    header.append(trace.id, style=_BOLD)
 
+    panel = Panel(
+        _rendered(_TRACE_BODIES, trace, _render_trace_body),
+        title=header,
+        border_style=_CYAN,
+        box=box.ROUNDED,
+    )
+    console.print(panel)
+
+
+def _render_trace_body(trace: Trace) -> str:
+    """Rich-markup panel body for display_trace."""
     content = []
 
     # Summary
@@ -78,7 +136,7 @@ def display_trace(trace: Trace) -> None:
         content.append(f"  Python:  {trace.environment.python}")
         if trace.environment.quantum_sdk:
             content.append(f"  SDK:     {trace.environment.quantum_sdk}")
-        for pkg in trace.environment.packages[:5]:
+        for pkg in islice(trace.environment.packages, 5):
             content.append(f"  {pkg.name}: {pkg.version}")
         content.append("")
 
@@ -128,13 +186,15 @@ def display_trace(trace: Trace) -> None:
 
             # Show T1/T2 for used qubits
             if h.qubits_used and cal.qubits:
-                for qi in h.qubits_used[:3]:  # Show first 3
-                    q = cal.qubit(qi)
+                qubit = cal.qubit
+                for qi in islice(h.qubits_used, 3):  # Show first 3
+                    q = qubit(qi)
                     if q and q.t1_us:
+                        # round() gives the same result as the ".0f" format spec
                         if q.t2_us:
-                            content.append(f"    Qubit {qi}: T1={q.t1_us:.0f}μs, T2={q.t2_us:.0f}μs")
+                            content.append(f"    Qubit {qi}: T1={round(q.t1_us)}μs, T2={round(q.t2_us)}μs")
                         else:
-                            content.append(f"    Qubit {qi}: T1={q.t1_us:.0f}μs")
+                            content.append(f"    Qubit {qi}: T1={round(q.t1_us)}μs")
         content.append("")
 
     # Execution
@@ -159,125 +219,123 @@ def display_trace(trace: Trace) -> None:
             bar = "█" * bar_len + "░" * (30 - bar_len)
             content.append(f"  |{bitstring}⟩ {bar} {prob * 100:5.1f}%")
 
-        if len(r.counts.raw) > 5:
-            content.append(f"  [dim]... and {len(r.counts.raw) - 5} more states[/dim]")
+        num_states = len(r.counts.raw)
+        if num_states > 5:
+            content.append(f"  [dim]... and {num_states - 5} more states[/dim]")
         content.append("")
 
-    panel = Panel(
-        "\n".join(content),
-        title=header,
-        border_style="cyan",
-        box=box.ROUNDED,
-    )
-    console.print(panel)
+    return "\n".join(content)
 
 
 def display_diff(trace1: Trace, trace2: Trace) -> None:
     """Display side-by-side comparison of two traces."""
+    env1, env2 = trace1.environment, trace2.environment
+
+    # content_hash covers everything compared below except the environment
+    same_env = (env1 and env1.python, env1 and env1.quantum_sdk) == (env2 and env2.python, env2 and env2.quantum_sdk)
+    if same_env and trace1.content_hash == trace2.content_hash:
+        console.print("[green]✓ Traces are identical (same content hash)[/green]")
+        return
+
     table = Table(
         title="QBOM Comparison",
         box=box.ROUNDED,
-        header_style="bold cyan",
+        header_style=_BOLD_CYAN,
     )
 
-    table.add_column("Property", style="dim")
-    table.add_column(trace1.id, style="white")
-    table.add_column(trace2.id, style="white")
+    table.add_column("Property", style=_DIM)
+    table.add_column(trace1.id, style=_WHITE)
+    table.add_column(trace2.id, style=_WHITE)
     table.add_column("Match", justify="center")
 
-    def add_row(prop: str, val1: str, val2: str) -> None:
-        match = "✓" if val1 == val2 else "✗"
-        match_style = "green" if val1 == val2 else "red"
-        table.add_row(prop, val1, val2, Text(match, style=match_style))
+    hw1, hw2 = trace1.hardware, trace2.hardware
+    exe1, exe2 = trace1.execution, trace2.execution
+    rows: list[tuple[str, str, str]] = []
 
     # Environment
-    if trace1.environment and trace2.environment:
-        add_row(
-            "Python",
-            trace1.environment.python,
-            trace2.environment.python,
-        )
-        add_row(
-            "Quantum SDK",
-            trace1.environment.quantum_sdk or "-",
-            trace2.environment.quantum_sdk or "-",
-        )
+    if env1 and env2:
+        rows.append(("Python", env1.python, env2.python))
+        rows.append(("Quantum SDK", env1.quantum_sdk or "-", env2.quantum_sdk or "-"))
 
     # Circuit
     if trace1.circuits and trace2.circuits:
         c1, c2 = trace1.circuits[0], trace2.circuits[0]
-        add_row("Circuit qubits", str(c1.num_qubits), str(c2.num_qubits))
-        add_row("Circuit depth", str(c1.depth), str(c2.depth))
-        add_row("Circuit hash", c1.hash, c2.hash)
+        rows.append(("Circuit qubits", str(c1.num_qubits), str(c2.num_qubits)))
+        rows.append(("Circuit depth", str(c1.depth), str(c2.depth)))
+        rows.append(("Circuit hash", c1.hash, c2.hash))
 
     # Hardware
-    if trace1.hardware and trace2.hardware:
-        add_row("Backend", trace1.hardware.backend, trace2.hardware.backend)
-        add_row(
-            "Physical qubits",
-            str(trace1.hardware.qubits_used),
-            str(trace2.hardware.qubits_used),
-        )
+    if hw1 and hw2:
+        rows.append(("Backend", hw1.backend, hw2.backend))
+        rows.append(("Physical qubits", str(hw1.qubits_used), str(hw2.qubits_used)))
 
     # Execution
-    if trace1.execution and trace2.execution:
-        add_row("Shots", str(trace1.execution.shots), str(trace2.execution.shots))
+    if exe1 and exe2:
+        rows.append(("Shots", str(exe1.shots), str(exe2.shots)))
+
+    # Match cells are shared templates; rendering doesn't modify them
+    add_row = table.add_row
+    for prop, val1, val2 in rows:
+        add_row(prop, val1, val2, _MATCH if val1 == val2 else _MISMATCH)
 
     console.print(table)
 
     # Analysis
-    if trace1.hardware and trace2.hardware:
-        if trace1.hardware.backend != trace2.hardware.backend:
+    if hw1 and hw2:
+        if hw1.backend != hw2.backend:
             console.print("\n[yellow]⚠ Different backends may explain result differences[/yellow]")
-        elif trace1.hardware.qubits_used != trace2.hardware.qubits_used:
+        elif hw1.qubits_used != hw2.qubits_used:
             console.print("\n[yellow]⚠ Different physical qubits may have different error rates[/yellow]")
 
 
+_PAPER_STATEMENT = """[bold]Reproducibility Statement[/bold]
+
+[dim](For Methods section)[/dim]
+
+{statement}.
+
+Complete QBOM trace: [cyan]{trace_id}[/cyan]
+Content hash: [dim]{content_hash}[/dim]"""
+
+
 def generate_paper_statement(trace: Trace) -> str:
     """Generate a reproducibility statement for academic papers."""
-    parts = []
-
-    parts.append("[bold]Reproducibility Statement[/bold]\n")
-    parts.append("[dim](For Methods section)[/dim]\n")
+    env = trace.environment
+    hw = trace.hardware
+    tp = trace.transpilation
+    ex = trace.execution
 
     statement_parts = []
 
     # Software
-    if trace.environment:
-        if trace.environment.quantum_sdk:
-            statement_parts.append(f"Experiments were performed using {trace.environment.quantum_sdk}")
+    if env and env.quantum_sdk:
+        statement_parts.append(f"Experiments were performed using {env.quantum_sdk}")
 
     # Hardware
-    if trace.hardware:
-        h = trace.hardware
-        if h.is_simulator:
-            statement_parts.append(f"on the {h.backend} simulator")
+    if hw:
+        if hw.is_simulator:
+            statement_parts.append(f"on the {hw.backend} simulator")
         else:
-            statement_parts.append(f"on the {h.provider} {h.backend} quantum processor ({h.num_qubits} qubits)")
+            statement_parts.append(f"on the {hw.provider} {hw.backend} quantum processor ({hw.num_qubits} qubits)")
 
     # Transpilation
-    if trace.transpilation and trace.transpilation.optimization_level:
-        opt_level = trace.transpilation.optimization_level
-        statement_parts.append(f"Circuits were transpiled with optimization level {opt_level}")
+    if tp and tp.optimization_level:
+        statement_parts.append(f"Circuits were transpiled with optimization level {tp.optimization_level}")
 
     # Execution
-    if trace.execution:
-        statement_parts.append(f"Each experiment used {trace.execution.shots:,} shots")
+    if ex:
+        statement_parts.append(f"Each experiment used {ex.shots:,} shots")
 
     # Calibration
-    if trace.hardware and trace.hardware.calibration:
-        cal_time = trace.hardware.calibration.timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
+    if hw and hw.calibration:
+        cal_time = hw.calibration.timestamp.strftime("%Y-%m-%dT%H:%M:%SZ")
         statement_parts.append(f"Hardware calibration data from {cal_time} was used")
 
-    # Combine
-    statement = ". ".join(statement_parts) + "."
-
-    parts.append(statement)
-    parts.append("")
-    parts.append(f"Complete QBOM trace: [cyan]{trace.id}[/cyan]")
-    parts.append(f"Content hash: [dim]{trace.content_hash}[/dim]")
-
-    return "\n".join(parts)
+    return _PAPER_STATEMENT.format(
+        statement=". ".join(statement_parts),
+        trace_id=trace.id,
+        content_hash=trace.content_hash,
+    )
 
 
 def display_verification(trace: Trace, path: str) -> None:
@@ -304,9 +362,7 @@ def display_verification(trace: Trace, path: str) -> None:
 
     # Display checks
     for name, passed in checks:
-        icon = "✓" if passed else "✗"
-        color = "green" if passed else "red"
-        console.print(f"  [{color}]{icon}[/{color}] {name}")
+        console.print((_PASS_MARK if passed else _FAIL_MARK) + name)
 
     console.print("")
 
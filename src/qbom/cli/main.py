@@ -6,12 +6,105 @@ Beautiful command-line interface for managing quantum experiment traces.
 
 from __future__ import annotations
 
-from pathlib import Path
+import functools
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+
+    from qbom.core.trace import Trace
+
+
+@functools.cache
+def _console() -> Console:
+    """Shared Rich console, created on first use so Rich loads only when printing."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Column specs (header, style, justify) for the report tables
+_SCORE_COLUMNS = (
+    ("Component", "cyan", "left"),
+    ("Category", "dim", "left"),
+    ("Score", None, "right"),
+    ("Status", None, "left"),
+)
+_QUBIT_DRIFT_COLUMNS = (
+    ("Qubit", None, "right"),
+    ("T1 Change", None, "right"),
+    ("T2 Change", None, "right"),
+    ("Readout Change", None, "right"),
+    ("Status", None, "left"),
+)
+_GATE_DRIFT_COLUMNS = (
+    ("Gate", None, "left"),
+    ("Qubits", None, "left"),
+    ("Error Change", None, "right"),
+    ("Status", None, "left"),
+)
+
+_GRADE_COLORS = {
+    "Excellent": "green",
+    "Good": "blue",
+    "Fair": "yellow",
+    "Poor": "orange1",
+    "Critical": "red",
+}
+_STATUS_ICONS = {"complete": "[green]●[/green]", "partial": "[yellow]◐[/yellow]", "missing": "[red]○[/red]"}
+_FEASIBILITY_COLORS = {
+    "High": "green",
+    "Medium": "yellow",
+    "Low": "orange1",
+    "Very Low": "red",
+}
+_DRIFT_STATUS = ("[green]Stable[/green]", "[red]Drift[/red]")  # Indexed by has_significant_drift
+_LEVEL_COLORS = {"error": "red", "warning": "yellow", "info": "dim"}  # Keyed by ValidationLevel value
+
+
+def _table(title: str, columns: tuple[tuple[str, str | None, str], ...]) -> Table:
+    """Empty table with the given static column layout."""
+    from rich.table import Table
+
+    table = Table(title=title, show_header=True)
+    for header, style, justify in columns:
+        table.add_column(header, style=style, justify=justify)  # type: ignore[arg-type]
+    return table
+
+
+def _load_trace(trace_id: str) -> Trace | None:
+    """Load a stored trace by full or partial ID, reporting when none matches."""
+    from qbom.core.session import Session
+    from qbom.core.trace import Trace
+
+    trace_path = Session.get()._resolve_trace_id(trace_id)
+    if trace_path is None:
+        _console().print(f"[red]Trace not found: {trace_id}[/red]")
+        return None
+    return Trace.load(trace_path)
+
+
+def _load_traces(*trace_ids: str) -> list[Trace] | None:
+    """Resolve every trace ID against one index, then parse the files concurrently."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from qbom.core.session import Session
+    from qbom.core.trace import Trace
+
+    session = Session.get()
+    paths = []
+    for trace_id in trace_ids:
+        trace_path = session._resolve_trace_id(trace_id)
+        if trace_path is None:
+            _console().print(f"[red]Trace not found: {trace_id}[/red]")
+            return None
+        paths.append(trace_path)
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        return [*pool.map(Trace.load, paths)]
 
 
 @click.group()
@@ -38,7 +131,7 @@ def list(limit: int) -> None:
     traces = session.list_traces(limit=limit)
 
     if not traces:
-        console.print("[dim]No traces found. Run a quantum experiment with QBOM imported.[/dim]")
+        _console().print("[dim]No traces found. Run a quantum experiment with QBOM imported.[/dim]")
         return
 
     display_trace_list(traces)
@@ -49,26 +142,9 @@ def list(limit: int) -> None:
 def show(trace_id: str) -> None:
     """Show detailed view of a trace."""
     from qbom.cli.display import display_trace
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
-
-    session = Session.get()
-
-    # Find trace
-    trace = None
-    trace_path = session._storage_path / f"{trace_id}.json"
-
-    if trace_path.exists():
-        trace = Trace.model_validate_json(trace_path.read_text())
-    else:
-        # Search by partial ID
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                trace = Trace.model_validate_json(path.read_text())
-                break
 
+    trace = _load_trace(trace_id)
     if trace is None:
-        console.print(f"[red]Trace not found: {trace_id}[/red]")
         return
 
     display_trace(trace)
@@ -93,26 +169,12 @@ def export(trace_id: str, output: str, format: str) -> None:
     - spdx: SPDX 2.3 SBOM with QBOM extension
     - yaml: YAML representation
     """
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
 
-    session = Session.get()
-    trace_path = session._storage_path / f"{trace_id}.json"
-
-    if not trace_path.exists():
-        # Search by partial ID
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                trace_path = path
-                break
-
-    if not trace_path.exists():
-        console.print(f"[red]Trace not found: {trace_id}[/red]")
+    trace = _load_trace(trace_id)
+    if trace is None:
         return
-
-    trace = Trace.model_validate_json(trace_path.read_text())
     output_path = trace.export(output, format=format)  # type: ignore
-    console.print(f"[green]Exported to:[/green] {output_path}")
+    _console().print(f"[green]Exported to:[/green] {output_path}")
 
 
 @main.command()
@@ -121,31 +183,12 @@ def export(trace_id: str, output: str, format: str) -> None:
 def diff(trace_id1: str, trace_id2: str) -> None:
     """Compare two traces side by side."""
     from qbom.cli.display import display_diff
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
-
-    session = Session.get()
-
-    def load_trace(trace_id: str) -> Trace | None:
-        trace_path = session._storage_path / f"{trace_id}.json"
-        if trace_path.exists():
-            return Trace.model_validate_json(trace_path.read_text())
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                return Trace.model_validate_json(path.read_text())
-        return None
 
-    trace1 = load_trace(trace_id1)
-    trace2 = load_trace(trace_id2)
-
-    if trace1 is None:
-        console.print(f"[red]Trace not found: {trace_id1}[/red]")
-        return
-    if trace2 is None:
-        console.print(f"[red]Trace not found: {trace_id2}[/red]")
+    traces = _load_traces(trace_id1, trace_id2)
+    if traces is None:
         return
 
-    display_diff(trace1, trace2)
+    display_diff(*traces)
 
 
 @main.command()
@@ -153,25 +196,12 @@ def diff(trace_id1: str, trace_id2: str) -> None:
 def paper(trace_id: str) -> None:
     """Generate reproducibility statement for a paper."""
     from qbom.cli.display import generate_paper_statement
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
 
-    session = Session.get()
-    trace_path = session._storage_path / f"{trace_id}.json"
-
-    if not trace_path.exists():
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                trace_path = path
-                break
-
-    if not trace_path.exists():
-        console.print(f"[red]Trace not found: {trace_id}[/red]")
+    trace = _load_trace(trace_id)
+    if trace is None:
         return
-
-    trace = Trace.model_validate_json(trace_path.read_text())
     statement = generate_paper_statement(trace)
-    console.print(statement)
+    _console().print(statement)
 
 
 @main.command()
@@ -181,13 +211,14 @@ def verify(path: str) -> None:
     from qbom.cli.display import display_verification
     from qbom.core.trace import Trace
 
-    trace = Trace.model_validate_json(Path(path).read_text())
+    trace = Trace.load(path)
     display_verification(trace, path)
 
 
 @main.command()
 def init() -> None:
     """Initialize QBOM in the current project."""
+    console = _console()
     console.print("[bold]QBOM Initialization[/bold]\n")
     console.print("Add this to your Python scripts or notebooks:\n")
     console.print("[cyan]import qbom  # That's it![/cyan]\n")
@@ -208,37 +239,17 @@ def score(trace_id: str) -> None:
     - 0-24:   Critical - Cannot reproduce
     """
     from rich.panel import Panel
-    from rich.table import Table
 
     from qbom.analysis import compute_score
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
-
-    session = Session.get()
-    trace_path = session._storage_path / f"{trace_id}.json"
-
-    if not trace_path.exists():
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                trace_path = path
-                break
 
-    if not trace_path.exists():
-        console.print(f"[red]Trace not found: {trace_id}[/red]")
+    console = _console()
+    trace = _load_trace(trace_id)
+    if trace is None:
         return
-
-    trace = Trace.model_validate_json(trace_path.read_text())
     result = compute_score(trace)
 
     # Display score
-    grade_colors = {
-        "Excellent": "green",
-        "Good": "blue",
-        "Fair": "yellow",
-        "Poor": "orange1",
-        "Critical": "red",
-    }
-    color = grade_colors.get(result.grade, "white")
+    color = _GRADE_COLORS.get(result.grade, "white")
 
     console.print()
     console.print(
@@ -250,16 +261,9 @@ def score(trace_id: str) -> None:
     )
 
     # Component breakdown
-    table = Table(title="Score Breakdown", show_header=True)
-    table.add_column("Component", style="cyan")
-    table.add_column("Category", style="dim")
-    table.add_column("Score", justify="right")
-    table.add_column("Status")
-
-    status_icons = {"complete": "[green]●[/green]", "partial": "[yellow]◐[/yellow]", "missing": "[red]○[/red]"}
-
+    table = _table("Score Breakdown", _SCORE_COLUMNS)
     for component in result.components:
-        status_icon = status_icons.get(component.status, "?")
+        status_icon = _STATUS_ICONS.get(component.status, "?")
         table.add_row(
             component.name,
             component.category,
@@ -287,26 +291,13 @@ def drift(trace_id: str) -> None:
     This helps understand why reproduction attempts might produce different results.
     """
     from rich.panel import Panel
-    from rich.table import Table
 
     from qbom.analysis import analyze_drift
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
-
-    session = Session.get()
-    trace_path = session._storage_path / f"{trace_id}.json"
 
-    if not trace_path.exists():
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                trace_path = path
-                break
-
-    if not trace_path.exists():
-        console.print(f"[red]Trace not found: {trace_id}[/red]")
+    console = _console()
+    trace = _load_trace(trace_id)
+    if trace is None:
         return
-
-    trace = Trace.model_validate_json(trace_path.read_text())
     result = analyze_drift(trace)
 
     if result is None:
@@ -314,13 +305,7 @@ def drift(trace_id: str) -> None:
         return
 
     # Display drift analysis
-    feasibility_colors = {
-        "High": "green",
-        "Medium": "yellow",
-        "Low": "orange1",
-        "Very Low": "red",
-    }
-    color = feasibility_colors.get(result.reproduction_feasibility, "white")
+    color = _FEASIBILITY_COLORS.get(result.reproduction_feasibility, "white")
 
     console.print()
     console.print(
@@ -343,15 +328,9 @@ def drift(trace_id: str) -> None:
 
     # Qubit drift table
     if result.qubit_drift:
-        table = Table(title="Qubit Drift", show_header=True)
-        table.add_column("Qubit", justify="right")
-        table.add_column("T1 Change", justify="right")
-        table.add_column("T2 Change", justify="right")
-        table.add_column("Readout Change", justify="right")
-        table.add_column("Status")
-
+        table = _table("Qubit Drift", _QUBIT_DRIFT_COLUMNS)
         for qd in result.qubit_drift:
-            status = "[red]Drift[/red]" if qd.has_significant_drift else "[green]Stable[/green]"
+            status = _DRIFT_STATUS[qd.has_significant_drift]
             table.add_row(
                 str(qd.qubit_index),
                 f"{qd.t1_change_percent:+.1f}%" if qd.t1_change_percent else "-",
@@ -363,14 +342,9 @@ def drift(trace_id: str) -> None:
 
     # Gate drift table
     if result.gate_drift:
-        table = Table(title="Gate Drift", show_header=True)
-        table.add_column("Gate")
-        table.add_column("Qubits")
-        table.add_column("Error Change", justify="right")
-        table.add_column("Status")
-
+        table = _table("Gate Drift", _GATE_DRIFT_COLUMNS)
         for gd in result.gate_drift:
-            status = "[red]Drift[/red]" if gd.has_significant_drift else "[green]Stable[/green]"
+            status = _DRIFT_STATUS[gd.has_significant_drift]
             table.add_row(
                 gd.gate_name,
                 str(list(gd.qubits)),
@@ -405,25 +379,13 @@ def validate(trace_id: str, publication: bool) -> None:
     """
     from rich.panel import Panel
 
-    from qbom.analysis import ValidationLevel, validate_for_publication, validate_trace
-    from qbom.core.session import Session
-    from qbom.core.trace import Trace
-
-    session = Session.get()
-    trace_path = session._storage_path / f"{trace_id}.json"
-
-    if not trace_path.exists():
-        for path in session._storage_path.glob("*.json"):
-            if trace_id in path.stem:
-                trace_path = path
-                break
+    from qbom.analysis import validate_for_publication, validate_trace
 
-    if not trace_path.exists():
-        console.print(f"[red]Trace not found: {trace_id}[/red]")
+    console = _console()
+    trace = _load_trace(trace_id)
+    if trace is None:
         return
 
-    trace = Trace.model_validate_json(trace_path.read_text())
-
     if publication:
         result = validate_for_publication(trace)
         title = "Publication Validation"
@@ -463,12 +425,7 @@ def validate(trace_id: str, publication: bool) -> None:
         for category, issues in categories.items():
             console.print(f"\n[bold]{category}:[/bold]")
             for issue in issues:
-                level_colors = {
-                    ValidationLevel.ERROR: "red",
-                    ValidationLevel.WARNING: "yellow",
-                    ValidationLevel.INFO: "dim",
-                }
-                color = level_colors.get(issue.level, "white")
+                color = _LEVEL_COLORS.get(issue.level.value, "white")
                 console.print(f"  [{color}]{issue.icon}[/{color}] {issue.message}")
                 console.print(f"    [dim]Fix: {issue.fix}[/dim]")
 
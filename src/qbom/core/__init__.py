@@ -1,15 +1,21 @@
 """Core QBOM models and functionality."""
 
-from qbom.core.models import (
-    Calibration,
-    Circuit,
-    Environment,
-    Execution,
-    Hardware,
-    Result,
-    Transpilation,
-)
-from qbom.core.trace import Trace
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qbom.core.models import (
+        Calibration,
+        Circuit,
+        Environment,
+        Execution,
+        Hardware,
+        Result,
+        Transpilation,
+    )
+    from qbom.core.trace import Trace
 
 __all__ = [
     "Trace",
@@ -21,3 +27,14 @@ __all__ = [
     "Execution",
     "Result",
 ]
+
+# Exports are imported on first access, so importing a submodule such as
+# qbom.core.session doesn't build every pydantic model up front
+_EXPORTS = {name: "qbom.core.trace" if name == "Trace" else "qbom.core.models" for name in __all__}
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,44 @@
+"""
+QBOM Content Hashing
+
+Fingerprints for circuits and results. These identify content for
+comparison and verification; they don't need cryptographic strength,
+so the fast 64-bit XXH3 hash is used throughout.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import xxhash
+
+
+def new_hasher() -> xxhash.xxh3_64:
+    """Create an incremental hasher; feed it with update(), read hexdigest()."""
+    return xxhash.xxh3_64()
+
+
+def fingerprint(data: bytes | str) -> str:
+    """Return the 16-hex-character fingerprint of data."""
+    if isinstance(data, str):
+        data = data.encode()
+    return xxhash.xxh3_64_hexdigest(data)
+
+
+def hash_counts(raw: Mapping[str, int]) -> str:
+    """
+    Order-independent fingerprint of measurement counts.
+
+    Outcomes are sorted and fed through one hasher, so every entry affects
+    the whole digest (unlike combining per-outcome digests with XOR, which
+    lets colliding histograms be built by hand). A fast identity check,
+    not tamper-proofing.
+    """
+    hasher = xxhash.xxh3_64()
+    for bitstring, count in sorted(raw.items()):
+        hasher.update(f"{bitstring}:{count};".encode())
+    return hasher.hexdigest()
+
+
+# Placeholder when content could not be hashed
+UNKNOWN_HASH = fingerprint(b"unknown")
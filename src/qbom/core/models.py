@@ -7,11 +7,19 @@ Designed to be beautiful, immutable, and serializable.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+import heapq
+import weakref
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from functools import cached_property
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, computed_field
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 
 class QBOMModel(BaseModel):
     """Base model with sensible defaults."""
@@ -22,6 +30,14 @@ class QBOMModel(BaseModel):
         "json_encoders": {datetime: lambda v: v.isoformat()},
     }
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the model, dropping cached properties when fields are updated."""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in copy.__dict__.keys() - type(copy).model_fields.keys():
+                del copy.__dict__[name]
+        return copy
+
 
 # ============================================================================
 # Environment
@@ -48,17 +64,27 @@ class Environment(QBOMModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
     @computed_field
-    @property
+    @cached_property
     def quantum_sdk(self) -> str | None:
         """Primary quantum SDK detected."""
-        sdk_priority = ["qiskit", "cirq", "pennylane", "braket"]
-        for sdk in sdk_priority:
-            for pkg in self.packages:
-                if pkg.name.startswith(sdk):
-                    return f"{pkg.name}=={pkg.version}"
+        # One pass over the packages, keeping the first match per SDK
+        found: dict[str, Package] = {}
+        for pkg in self.packages:
+            name = pkg.name
+            for sdk in _SDK_PRIORITY:
+                if name.startswith(sdk):
+                    found.setdefault(sdk, pkg)
+                    break
+        for sdk in _SDK_PRIORITY:
+            match = found.get(sdk)
+            if match is not None:
+                return f"{match.name}=={match.version}"
         return None
 
 
+_SDK_PRIORITY = ("qiskit", "cirq", "pennylane", "braket")
+
+
 # ============================================================================
 # Circuit
 # ============================================================================
@@ -72,6 +98,24 @@ class GateCounts(QBOMModel):
     total: int = 0
     by_name: dict[str, int] = Field(default_factory=dict)
 
+    @classmethod
+    def shared(cls, by_name: dict[str, int], single_qubit: int, two_qubit: int, total: int) -> GateCounts:
+        """
+        GateCounts for a histogram, reusing a live identical instance.
+
+        Sweeps capture the same gate histogram over and over; since models are
+        immutable, every circuit with that histogram can share one record.
+        """
+        key = (single_qubit, two_qubit, total, frozenset(by_name.items()))
+        counts = _GATE_COUNTS_POOL.get(key)
+        if counts is None:
+            counts = cls(single_qubit=single_qubit, two_qubit=two_qubit, total=total, by_name=by_name)
+            _GATE_COUNTS_POOL[key] = counts
+        return counts
+
+
+_GATE_COUNTS_POOL: weakref.WeakValueDictionary[tuple, GateCounts] = weakref.WeakValueDictionary()
+
 
 class Circuit(QBOMModel):
     """Quantum circuit representation (framework-agnostic)."""
@@ -81,14 +125,14 @@ class Circuit(QBOMModel):
     num_clbits: int = 0
     depth: int
     gates: GateCounts
-    hash: str = Field(description="Content-addressable hash of circuit")
+    hash: str = Field(description="Content-addressable hash of circuit (XXH3-64, 16 hex chars)")
 
     # Optional detailed representations
     qasm: str | None = Field(default=None, description="OpenQASM representation")
     json_repr: dict[str, Any] | None = Field(default=None, description="Native JSON format")
 
     @computed_field
-    @property
+    @cached_property
     def summary(self) -> str:
         """Human-readable circuit summary."""
         name = self.name or "circuit"
@@ -173,19 +217,31 @@ class Calibration(QBOMModel):
     qubits: list[QubitProperties] = Field(default_factory=list)
     gates: list[GateProperties] = Field(default_factory=list)
 
+    @cached_property
+    def epoch_seconds(self) -> float:
+        """Calibration time as seconds since the epoch (naive timestamps are UTC)."""
+        timestamp = self.timestamp
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+
+    @cached_property
+    def _qubit_by_index(self) -> dict[int, QubitProperties]:
+        # Built in reverse so the first entry for a repeated index wins
+        return {q.index: q for q in reversed(self.qubits)}
+
+    @cached_property
+    def _gate_by_key(self) -> dict[tuple[str, tuple[int, ...]], tuple[float | None]]:
+        # Errors are boxed so a recorded None is distinguishable from a miss
+        return {(g.gate, g.qubits): (g.error,) for g in reversed(self.gates)}
+
     def qubit(self, index: int) -> QubitProperties | None:
         """Get properties for a specific qubit."""
-        for q in self.qubits:
-            if q.index == index:
-                return q
-        return None
+        return self._qubit_by_index.get(index)
 
     def gate_error(self, gate: str, qubits: tuple[int, ...]) -> float | None:
         """Get error rate for a specific gate on specific qubits."""
-        for g in self.gates:
-            if g.gate == gate and g.qubits == qubits:
-                return g.error
-        return None
+        return self._gate_by_key.get((gate, qubits), (None,))[0]
 
 
 class Hardware(QBOMModel):
@@ -225,10 +281,12 @@ class Execution(QBOMModel):
     shots: int
     seed: int | None = None
     error_mitigation: ErrorMitigation | None = None
+    parameters: dict[str, Any] | None = Field(default=None, description="Resolved circuit parameter values")
 
     submitted_at: datetime | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
+    duration_ns: int | None = None  # Monotonic-clock duration of the call
 
     @computed_field
     @property
@@ -244,6 +302,8 @@ class Execution(QBOMModel):
         """Actual execution time."""
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
+        if self.duration_ns is not None:
+            return self.duration_ns / 1e9
         return None
 
 
@@ -252,24 +312,78 @@ class Execution(QBOMModel):
 # ============================================================================
 
 
+# Above this many outcomes, probabilities and top results are computed with
+# numpy when available
+_VECTORIZE_THRESHOLD = 1024
+
+# Columnar views of large Counts, keyed by id(counts). They hold numpy arrays,
+# so they are kept out of the model's __dict__ (pydantic's __eq__ compares it,
+# and arrays have no single truth value); entries are evicted when the Counts
+# is garbage collected.
+_COLUMNS: dict[int, tuple[list[str], Any]] = {}
+
+
 class Counts(QBOMModel):
     """Measurement result counts."""
 
     raw: dict[str, int]
     shots: int
 
+    def _columns(self) -> tuple[list[str], Any] | None:
+        """
+        Outcomes and their probabilities as parallel columns (a list and a
+        numpy array), or None for small results or without numpy.
+        """
+        key = id(self)
+        columns = _COLUMNS.get(key)
+        if columns is not None:
+            return columns
+
+        raw = self.raw
+        if len(raw) <= _VECTORIZE_THRESHOLD:
+            return None
+        try:
+            import numpy as np  # Optional dependency
+        except ImportError:
+            return None
+        values = np.fromiter(raw.values(), dtype=np.float64, count=len(raw))
+        values /= self.shots
+        columns = (list(raw), values)
+        try:
+            weakref.finalize(self, _COLUMNS.pop, key, None)
+            _COLUMNS[key] = columns
+        except TypeError:
+            pass  # Not weak-referenceable; skip caching
+        return columns
+
     @computed_field
-    @property
+    @cached_property
     def probabilities(self) -> dict[str, float]:
-        """Convert counts to probabilities."""
-        return {k: v / self.shots for k, v in self.raw.items()}
+        """Convert counts to probabilities (computed once)."""
+        columns = self._columns()
+        if columns is not None:
+            keys, values = columns
+            return dict(zip(keys, values.tolist()))
+        shots = self.shots
+        return {k: v / shots for k, v in self.raw.items()}
 
     @computed_field
-    @property
+    @cached_property
     def top_results(self) -> list[tuple[str, float]]:
-        """Top 5 results by probability."""
-        probs = sorted(self.probabilities.items(), key=lambda x: -x[1])
-        return probs[:5]
+        """Top 5 results by probability (computed once)."""
+        columns = self._columns()
+        if columns is None:
+            return heapq.nlargest(5, self.probabilities.items(), key=itemgetter(1))
+
+        import numpy as np  # Optional dependency; present if _columns() returned
+
+        # Keep only outcomes at or above the 5th-largest probability (linear
+        # time), then rank those in outcome order so ties break as before
+        keys, values = columns
+        cutoff = np.partition(values, -5)[-5]
+        indices = np.flatnonzero(values >= cutoff)
+        candidates = zip([keys[i] for i in indices.tolist()], values[indices].tolist())
+        return heapq.nlargest(5, candidates, key=itemgetter(1))
 
 
 class Result(QBOMModel):
@@ -278,7 +392,7 @@ class Result(QBOMModel):
     counts: Counts
     memory: list[str] | None = Field(default=None, description="Shot-by-shot results if available")
     metadata: dict[str, Any] = Field(default_factory=dict)
-    hash: str = Field(description="Hash of raw results for verification")
+    hash: str = Field(description="Hash of raw results for verification (XXH3-64, 16 hex chars)")
 
     # Mitigated results (if error mitigation was applied)
     mitigated_counts: Counts | None = None
@@ -9,21 +9,30 @@ capturing quantum operations.
 from __future__ import annotations
 
 import atexit
+import bisect
 import importlib
+import os
 import platform
 import sys
+import tempfile
 import threading
-from collections.abc import Iterator
+import time
+import warnings
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
+from importlib.abc import Loader
+from importlib.machinery import ModuleSpec
 from pathlib import Path
+from types import ModuleType
 from typing import TYPE_CHECKING
 
-from qbom.core.models import Environment, Package
-from qbom.core.trace import Trace, TraceBuilder
-
 if TYPE_CHECKING:
     from qbom.adapters.base import Adapter
+    from qbom.core.models import Environment, Package
+    from qbom.core.trace import Trace, TraceBuilder
 
 
 class QBOMImportFinder:
@@ -44,35 +53,62 @@ class QBOMImportFinder:
         "pennylane": "pennylane",
     }
 
-    def find_module(self, fullname: str, path: str | None = None) -> QBOMImportFinder | None:
-        """Called when Python tries to import a module."""
-        # Check if this is a quantum framework we care about
-        base_module = fullname.split(".")[0]
-        if base_module in self.WATCHED_MODULES:
-            return self
-        return None
+    def find_spec(self, fullname: str, path: object = None, target: object = None) -> ModuleSpec | None:
+        """
+        Called when Python tries to import a module.
 
-    def load_module(self, fullname: str) -> object:
-        """Load the module and install our adapter."""
-        # Remove ourselves temporarily to avoid recursion
-        sys.meta_path.remove(self)
+        Only top-level framework packages are intercepted. The real spec is
+        resolved by the remaining finders and its loader wrapped so the
+        adapter is installed once the module has finished executing.
+        """
+        framework = self.WATCHED_MODULES.get(fullname)
+        if framework is None:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
 
-        try:
-            # Import the actual module
-            module = importlib.import_module(fullname)
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _AdapterInstallingLoader(spec.loader, framework)
+        return spec
 
-            # Install/update adapter for this framework
-            base_module = fullname.split(".")[0]
-            framework = self.WATCHED_MODULES.get(base_module)
-            if framework:
-                # Re-install adapter to pick up new classes (like AerBackend)
-                Session.get()._reinstall_adapter_for(framework)
 
-            return module
-        finally:
-            # Re-add ourselves
-            if self not in sys.meta_path:
-                sys.meta_path.insert(0, self)
+class _AdapterInstallingLoader(Loader):
+    """Delegates to the real loader, then installs the framework's adapter."""
+
+    def __init__(self, loader: Loader, framework: str) -> None:
+        self._loader = loader
+        self._framework = framework
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        # Put the real loader back so the module never sees this wrapper
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        self._loader.exec_module(module)
+
+        # Install/update adapter now that the framework is importable
+        # (re-install picks up new classes like AerBackend)
+        Session.get()._reinstall_adapter_for(self._framework)
+
+
+def _run_deferred(func: Callable[..., None], *args: object) -> None:
+    """Run one deferred capture task, warning instead of raising on failure."""
+    try:
+        func(*args)
+    except Exception as exc:
+        # Capture must never break user code, but a lost trace shouldn't be silent
+        warnings.warn(f"QBOM capture failed: {exc!r}", RuntimeWarning, stacklevel=2)
 
 
 class Session:
@@ -81,18 +117,51 @@ class Session:
 
     A session captures all quantum operations from import to exit.
     Sessions can be nested for scoped experiments.
+
+    Each thread has its own current builder, so executions running in
+    parallel threads are captured as separate traces.
     """
 
     _instance: Session | None = None
     _lock = threading.Lock()
 
-    def __init__(self) -> None:
-        self._traces: list[Trace] = []
-        self._current_builder: TraceBuilder | None = None
+    # Finished traces kept in memory; older ones are evicted (see _record)
+    MAX_IN_MEMORY_TRACES = 1024
+
+    # How much detail adapters record:
+    #   minimal  - one circuit per batch execution (skips per-tape extraction)
+    #   standard - every circuit; QASM only for small circuits (default)
+    #   full     - every circuit, with QASM regardless of size
+    CAPTURE_LEVELS = ("minimal", "standard", "full")
+
+    def __init__(self, capture_level: str | None = None) -> None:
+        if capture_level is None:
+            # An unrecognized environment value must not break `import qbom`
+            capture_level = os.environ.get("QBOM_CAPTURE_LEVEL", "").lower()
+            if capture_level not in self.CAPTURE_LEVELS:
+                capture_level = "standard"
+        elif capture_level not in self.CAPTURE_LEVELS:
+            raise ValueError(f"capture_level must be one of {', '.join(self.CAPTURE_LEVELS)}")
+        self.capture_level = capture_level
+
+        self._traces: deque[Trace] = deque(maxlen=self.MAX_IN_MEMORY_TRACES)
+        self._saved_ids: set[str] = set()  # In-memory traces already saved to storage
+        self._evicted: list[tuple[str, bool]] = []  # (trace ID, spilled) per evicted trace, oldest first
+        self._spill_path: Path | None = None  # Evicted traces that were never saved
+        self._traces_lock = threading.Lock()
+        self._local = threading.local()  # Per-thread current builder
         self._adapters: list[Adapter] = []
         self._storage_path = Path.home() / ".qbom" / "traces"
         self._auto_save = True
         self._started = False
+        self._packages: tuple[Package, ...] | None = None
+        self._capture_pool: ThreadPoolExecutor | None = None
+        self._pending: deque[Future[None]] = deque()
+        self._trace_id_index: tuple[int, list[str]] | None = None  # (storage mtime, sorted IDs)
+
+        # Wall-clock anchor for converting perf_counter_ns() readings
+        self._wall_anchor = datetime.utcnow()
+        self._perf_anchor = time.perf_counter_ns()
 
     @classmethod
     def get(cls) -> Session:
@@ -105,7 +174,14 @@ class Session:
 
     @classmethod
     def auto_start(cls) -> None:
-        """Auto-start session on import (called from __init__.py)."""
+        """
+        Auto-start session on import (called from __init__.py).
+
+        Set QBOM_DISABLE=1 to import qbom without installing any hooks, so
+        framework methods run with no instrumentation at all.
+        """
+        if os.environ.get("QBOM_DISABLE", "").lower() in ("1", "true", "yes"):
+            return
         session = cls.get()
         if not session._started:
             session.start()
@@ -118,9 +194,8 @@ class Session:
         self._started = True
         self._storage_path.mkdir(parents=True, exist_ok=True)
 
-        # Capture initial environment
-        self._current_builder = TraceBuilder()
-        self._current_builder.set_environment(self._capture_environment())
+        # The first builder (and its environment scan) is created on first
+        # capture by current_builder, keeping `import qbom` cheap.
 
         # Install import hook to detect quantum frameworks imported later
         self._import_finder = QBOMImportFinder()
@@ -134,7 +209,28 @@ class Session:
 
     def _capture_environment(self) -> Environment:
         """Capture current software environment."""
-        packages = []
+        from qbom.core.models import Environment
+
+        return Environment(
+            python=platform.python_version(),
+            platform=platform.platform(),
+            packages=list(self._installed_packages()),
+            timestamp=datetime.utcnow(),
+        )
+
+    def _installed_packages(self) -> tuple[Package, ...]:
+        """
+        Scan installed distributions once per session.
+
+        Package records are frozen, so every trace shares the same instances
+        instead of re-scanning site-packages and allocating new copies.
+        """
+        if self._packages is not None:
+            return self._packages
+
+        from qbom.core.models import Package
+
+        packages: list[Package] = []
 
         # Get installed packages
         try:
@@ -148,38 +244,33 @@ class Session:
                 "pytket",
                 "pyquil",
             )
+            core_packages = ("numpy", "scipy")
+            core: list[Package] = []
             for dist in distributions():
                 name = dist.metadata["Name"]
-                if name and any(name.lower().startswith(p) for p in quantum_prefixes):
-                    packages.append(
-                        Package(
-                            name=name.lower(),
-                            version=dist.version,
-                            purl=f"pkg:pypi/{name.lower()}@{dist.version}",
-                        )
-                    )
-
-            # Always include core scientific packages
-            core_packages = ["numpy", "scipy"]
-            for dist in distributions():
-                name = dist.metadata["Name"]
-                if name and name.lower() in core_packages:
-                    packages.append(
-                        Package(
-                            name=name.lower(),
-                            version=dist.version,
-                            purl=f"pkg:pypi/{name.lower()}@{dist.version}",
-                        )
+                if not name:
+                    continue
+                lowered = name.lower()
+                if lowered.startswith(quantum_prefixes):
+                    target = packages
+                elif lowered in core_packages:
+                    # Always include core scientific packages
+                    target = core
+                else:
+                    continue
+                target.append(
+                    Package(
+                        name=lowered,
+                        version=dist.version,
+                        purl=f"pkg:pypi/{lowered}@{dist.version}",
                     )
+                )
+            packages.extend(core)
         except Exception:
             pass  # Graceful degradation
 
-        return Environment(
-            python=platform.python_version(),
-            platform=platform.platform(),
-            packages=packages,
-            timestamp=datetime.utcnow(),
-        )
+        self._packages = tuple(packages)
+        return self._packages
 
     # Mapping of framework name to adapter info
     ADAPTER_MAP = {
@@ -208,8 +299,11 @@ class Session:
         try:
             mod = importlib.import_module(adapter_module)
             adapter = getattr(mod, adapter_class)(self)
-            adapter.install()
+            # Register before install(): installing can import framework
+            # submodules (e.g. qiskit_aer), which re-enters
+            # _reinstall_adapter_for and must find this adapter, not add another
             self._adapters.append(adapter)
+            adapter.install()
         except ImportError:
             pass  # Adapter not available
 
@@ -233,43 +327,260 @@ class Session:
             # Install for first time
             self._install_adapter_for(framework)
 
+    @property
+    def _current_builder(self) -> TraceBuilder | None:
+        return getattr(self._local, "builder", None)
+
+    @_current_builder.setter
+    def _current_builder(self, builder: TraceBuilder | None) -> None:
+        self._local.builder = builder
+
     @property
     def current_builder(self) -> TraceBuilder:
         """Get the current trace builder."""
         if self._current_builder is None:
-            self._current_builder = TraceBuilder()
-            self._current_builder.set_environment(self._capture_environment())
+            self._current_builder = self._new_builder()
         return self._current_builder
 
-    def finalize_trace(self) -> Trace:
+    def _new_builder(self) -> TraceBuilder:
+        """A fresh builder carrying the current environment."""
+        # Imported on first capture, so `import qbom` doesn't build the models
+        from qbom.core.trace import TraceBuilder
+
+        return TraceBuilder().set_environment(self._capture_environment())
+
+    @property
+    def paused(self) -> bool:
+        """Whether capture is paused in the current thread (see pause())."""
+        return getattr(self._local, "paused", False)
+
+    @contextmanager
+    def pause(self) -> Iterator[None]:
+        """
+        Temporarily stop capturing in the current thread.
+
+        Hooks check this flag first and call straight through to the
+        framework, e.g. for warm-up iterations or benchmarking.
+        """
+        previous = self.paused
+        self._local.paused = True
+        try:
+            yield
+        finally:
+            self._local.paused = previous
+
+    def timestamp(self, perf_ns: int) -> datetime:
+        """
+        Convert a time.perf_counter_ns() reading to a UTC datetime.
+
+        Adapters time executions with the monotonic clock and convert only
+        when the trace is assembled.
+        """
+        return self._wall_anchor + timedelta(microseconds=(perf_ns - self._perf_anchor) // 1000)
+
+    def detach_builder(self) -> TraceBuilder:
+        """
+        Take ownership of the current builder and start a fresh one.
+
+        Used by adapters that finish a trace off the hot path: the detached
+        builder is later passed to finalize_trace(builder).
+        """
+        builder = self.current_builder
+        self._current_builder = self._new_builder()
+        return builder
+
+    def finalize_trace(self, builder: TraceBuilder | None = None) -> Trace:
         """
         Finalize and save the current trace.
 
         Called when an experiment completes (e.g., after job.result()).
+        If a detached builder is given, it is finalized instead and the
+        current builder is left untouched.
         """
+        if builder is not None:
+            return self._record(builder.build())
+
         if self._current_builder is None:
             raise RuntimeError("No active trace to finalize")
 
-        trace = self._current_builder.build()
-        self._traces.append(trace)
+        trace = self._record(self._current_builder.build())
+
+        # Start a new builder for the next experiment
+        self._current_builder = self._new_builder()
+
+        return trace
+
+    # ========================================================================
+    # Deferred Capture
+    # ========================================================================
+
+    def defer(self, func: Callable[..., None], *args: object) -> None:
+        """
+        Run capture work on the background worker.
+
+        Tasks run one at a time in submission order, so traces are finalized
+        in the same order the user's executions happened. A failing task is
+        reported with a RuntimeWarning rather than raised.
+        """
+        if self._capture_pool is None:
+            with self._lock:
+                if self._capture_pool is None:
+                    self._capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qbom-capture")
+        pending = self._pending
+        while pending and pending[0].done():
+            pending.popleft()
+        try:
+            pending.append(self._capture_pool.submit(_run_deferred, func, *args))
+        except RuntimeError:
+            # Executor already shut down (interpreter exit); capture inline
+            _run_deferred(func, *args)
+
+    def flush(self) -> None:
+        """Wait for all deferred capture work to finish."""
+        while self._pending:
+            self._pending.popleft().result()
 
-        if self._auto_save:
+    def _record(self, trace: Trace) -> Trace:
+        """
+        Store a finished trace (and save it when auto-save is on).
+
+        Memory stays bounded on long runs: once MAX_IN_MEMORY_TRACES are held,
+        the oldest trace is evicted. A trace that was saved when recorded is
+        already on disk; any other evicted trace is appended to a JSONL spill
+        file, whatever the current auto-save setting. iter_all_traces() still
+        returns everything.
+        """
+        saved = self._auto_save
+        if saved:
             self._save_trace(trace)
 
-        # Start a new builder for the next experiment
-        self._current_builder = TraceBuilder()
-        self._current_builder.set_environment(self._capture_environment())
+        with self._traces_lock:
+            traces = self._traces
+            if len(traces) == traces.maxlen:
+                evicted = traces[0]
+                if evicted.id in self._saved_ids:
+                    self._saved_ids.discard(evicted.id)
+                    self._evicted.append((evicted.id, False))
+                else:
+                    self._spill(evicted)
+                    self._evicted.append((evicted.id, True))
+            traces.append(trace)
+            if saved:
+                self._saved_ids.add(trace.id)
 
         return trace
 
+    def _spill(self, trace: Trace) -> None:
+        """Append an evicted trace to this session's spill file."""
+        if self._spill_path is None:
+            fd, name = tempfile.mkstemp(prefix="qbom-spill-", suffix=".jsonl")
+            os.close(fd)
+            self._spill_path = Path(name)
+        with self._spill_path.open("a", encoding="utf-8") as f:
+            f.write(trace.model_dump_json(exclude_none=True))
+            f.write("\n")
+
+    def iter_all_traces(self) -> Iterator[Trace]:
+        """Iterate over every trace finalized in this session, oldest first."""
+        from qbom.core.trace import Trace
+
+        self.flush()
+
+        with self._traces_lock:
+            evicted = list(self._evicted)
+            recent = list(self._traces)
+
+        # Evicted traces come from storage or the spill file, interleaved in
+        # eviction order; spilled lines are in that same order
+        spill_path = self._spill_path
+        spill = spill_path.open(encoding="utf-8") if spill_path is not None and spill_path.exists() else None
+        lines = spill if spill is not None else iter(())
+        try:
+            for trace_id, spilled in evicted:
+                if spilled:
+                    line = next(lines, None)
+                    if line is not None:
+                        yield Trace.model_validate_json(line)
+                    continue
+                try:
+                    yield Trace.model_validate_json((self._storage_path / f"{trace_id}.json").read_bytes())
+                except Exception:
+                    pass  # Removed from storage since
+        finally:
+            if spill is not None:
+                spill.close()
+
+        yield from recent
+
     def _save_trace(self, trace: Trace) -> Path:
         """Save trace to local storage."""
         path = self._storage_path / f"{trace.id}.json"
         trace.export(path)
         return path
 
+    def _trace_ids(self) -> list[str]:
+        """
+        Sorted IDs of the traces in storage.
+
+        The list is kept in ~/.qbom/index.txt, stamped with the storage
+        directory's mtime; saving or deleting a trace changes that mtime, and
+        the next lookup rebuilds the index with a single directory scan.
+        """
+        try:
+            mtime = self._storage_path.stat().st_mtime_ns
+        except OSError:
+            return []
+
+        cached = self._trace_id_index
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        index_path = self._storage_path.parent / "index.txt"
+        ids: list[str] | None = None
+        try:
+            stamp, *lines = index_path.read_text().splitlines()
+            if int(stamp) == mtime:
+                ids = lines
+        except (OSError, ValueError):
+            pass  # Missing or corrupt index; rebuild it
+
+        if ids is None:
+            with os.scandir(self._storage_path) as entries:
+                ids = sorted(entry.name[:-5] for entry in entries if entry.name.endswith(".json"))
+            try:
+                index_path.write_text("\n".join([str(mtime), *ids]) + "\n")
+            except OSError:
+                pass  # Read-only home; keep the in-memory index
+
+        self._trace_id_index = (mtime, ids)
+        return ids
+
+    def _resolve_trace_id(self, partial: str) -> Path | None:
+        """
+        Path of the stored trace matching a full or partial ID.
+
+        An exact ID wins, then the first ID starting with partial (with or
+        without the "qbom_" prefix), then the first ID containing it.
+        """
+        path = self._storage_path / f"{partial}.json"
+        if path.exists():
+            return path
+
+        ids = self._trace_ids()
+        for prefix in (partial, f"qbom_{partial}"):
+            i = bisect.bisect_left(ids, prefix)
+            if i < len(ids) and ids[i].startswith(prefix):
+                return self._storage_path / f"{ids[i]}.json"
+
+        for trace_id in ids:
+            if partial in trace_id:
+                return self._storage_path / f"{trace_id}.json"
+        return None
+
     def _on_exit(self) -> None:
         """Called when Python exits."""
+        self.flush()
+
         # Finalize any pending trace
         if self._current_builder and self._current_builder._data.get("result"):
             try:
@@ -277,6 +588,9 @@ class Session:
             except Exception:
                 pass  # Don't raise during shutdown
 
+        if self._spill_path is not None:
+            self._spill_path.unlink(missing_ok=True)
+
         # Uninstall adapters
         for adapter in self._adapters:
             try:
@@ -304,17 +618,20 @@ class Session:
                 pass
             # Trace is automatically finalized and saved
         """
+        self.flush()
+
         # Save current builder
         parent_builder = self._current_builder
 
         # Create new builder for this experiment
-        self._current_builder = TraceBuilder()
-        self._current_builder.set_environment(self._capture_environment())
+        self._current_builder = self._new_builder()
         self._current_builder.set_metadata(name=name, description=description, tags=tags)
 
         try:
             yield self._current_builder
         finally:
+            self.flush()
+
             # Finalize this experiment
             if self._current_builder._data.get("result"):
                 self.finalize_trace()
@@ -328,18 +645,44 @@ class Session:
 
     def list_traces(self, limit: int = 10) -> list[Trace]:
         """List recent traces."""
+        from qbom.core.trace import Trace
+
+        self.flush()
+
         # Combine in-memory and saved traces
-        traces = list(self._traces)
+        with self._traces_lock:
+            traces = list(self._traces)
 
-        # Load from disk
-        if self._storage_path.exists():
-            for path in sorted(self._storage_path.glob("*.json"), reverse=True):
-                if len(traces) >= limit:
-                    break
+        # Load from disk, newest first: one directory scan for names and
+        # mtimes, then the files are parsed on a thread pool
+        needed = limit - len(traces)
+        if needed > 0:
+            try:
+                with os.scandir(self._storage_path) as entries:
+                    stamped = [
+                        (entry.stat().st_mtime_ns, entry.path) for entry in entries if entry.name.endswith(".json")
+                    ]
+            except OSError:
+                stamped = []
+            stamped.sort(reverse=True)
+
+            def load(path: str) -> Trace | None:
                 try:
-                    traces.append(Trace.model_validate_json(path.read_text()))
+                    return Trace.model_validate_json(Path(path).read_bytes())
                 except Exception:
-                    pass
+                    return None
+
+            # Unreadable files are skipped, so keep taking the next-newest
+            # batch until enough traces have loaded
+            paths = [path for _, path in stamped]
+            start = 0
+            with ThreadPoolExecutor(max_workers=min(needed, os.cpu_count() or 1)) as pool:
+                while needed > 0 and start < len(paths):
+                    batch = paths[start : start + needed]
+                    start += len(batch)
+                    loaded = [trace for trace in pool.map(load, batch) if trace is not None]
+                    traces.extend(loaded)
+                    needed -= len(loaded)
 
         return traces[:limit]
 
@@ -358,6 +701,7 @@ def current() -> Trace:
     returns the most recently finalized trace instead.
     """
     session = Session.get()
+    session.flush()
     builder = session.current_builder
 
     # If current builder has meaningful data, return it
@@ -384,6 +728,22 @@ def show() -> None:
     trace.show()
 
 
+@contextmanager
+def pause() -> Iterator[None]:
+    """
+    Run quantum code without capturing it.
+
+    Example:
+        import qbom
+
+        with qbom.pause():
+            for _ in range(50):
+                simulator.run(circuit)  # Warm-up, not recorded
+    """
+    with Session.get().pause():
+        yield
+
+
 @contextmanager
 def experiment(
     name: str | None = None,
@@ -9,9 +9,13 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
+from array import array
+from collections.abc import Mapping
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import BaseModel, Field, computed_field
 
@@ -24,6 +28,9 @@ from qbom.core.models import (
     Transpilation,
 )
 
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
 
 def _generate_id() -> str:
     """Generate a short, memorable trace ID."""
@@ -32,6 +39,62 @@ def _generate_id() -> str:
     return f"qbom_{secrets.token_hex(4)}"
 
 
+def _dumps(document: dict[str, Any]) -> str:
+    """Serialize an SBOM document, using orjson when it is installed."""
+    try:
+        import orjson  # Optional dependency
+    except ImportError:
+        return json.dumps(document, indent=2, default=str)
+    return orjson.dumps(document, option=orjson.OPT_INDENT_2, default=str).decode()
+
+
+# Histograms larger than this can be moved to a binary sidecar on export
+BINARY_COUNTS_THRESHOLD = 1024
+_COUNTS_MAGIC = b"QBC1"
+
+
+def _write_counts_sidecar(path: Path, raw: dict[str, int]) -> bool:
+    """
+    Write counts as packed little-endian uint64 key/value arrays.
+
+    Only plain fixed-width bitstrings of up to 64 bits are packed; anything
+    else (register separators, very wide registers) stays inline in JSON.
+    """
+    width = len(next(iter(raw)))
+    if not 0 < width <= 64:
+        return False
+    try:
+        keys = array("Q", [int(k, 2) for k in raw if len(k) == width])
+    except ValueError:
+        return False  # Not a pure bitstring
+    if len(keys) != len(raw):
+        return False
+    values = array("Q", raw.values())
+    if sys.byteorder == "big":
+        keys.byteswap()
+        values.byteswap()
+    header = _COUNTS_MAGIC + len(raw).to_bytes(8, "little") + width.to_bytes(2, "little")
+    path.write_bytes(header + keys.tobytes() + values.tobytes())
+    return True
+
+
+def _read_counts_sidecar(path: Path) -> dict[str, int]:
+    """Decode a counts sidecar written by _write_counts_sidecar."""
+    data = path.read_bytes()
+    if data[:4] != _COUNTS_MAGIC:
+        raise ValueError(f"Not a QBOM counts file: {path}")
+    n = int.from_bytes(data[4:12], "little")
+    width = int.from_bytes(data[12:14], "little")
+    keys = array("Q")
+    values = array("Q")
+    keys.frombytes(data[14 : 14 + 8 * n])
+    values.frombytes(data[14 + 8 * n : 14 + 16 * n])
+    if sys.byteorder == "big":
+        keys.byteswap()
+        values.byteswap()
+    return {format(k, f"0{width}b"): v for k, v in zip(keys, values)}
+
+
 class Metadata(BaseModel):
     """User-provided metadata for a trace."""
 
@@ -95,11 +158,11 @@ class Trace(BaseModel):
         parts = []
 
         if self.circuits:
-            c = self.circuits[0]
-            if len(self.circuits) > 1:
-                parts.append(f"{len(self.circuits)} circuits")
+            num_circuits = len(self.circuits)
+            if num_circuits > 1:
+                parts.append(f"{num_circuits} circuits")
             else:
-                parts.append(f"{c.num_qubits}q circuit")
+                parts.append(f"{self.circuits[0].num_qubits}q circuit")
 
         if self.hardware:
             parts.append(f"on {self.hardware.backend}")
@@ -110,13 +173,14 @@ class Trace(BaseModel):
         return " | ".join(parts) if parts else "Empty trace"
 
     @computed_field
-    @property
+    @cached_property
     def content_hash(self) -> str:
         """
         Content-addressable hash of the trace.
 
         This hash uniquely identifies the experiment based on its content,
-        enabling verification that results haven't been tampered with.
+        enabling verification that results haven't changed since capture.
+        Traces are immutable, so it is computed once on first access.
         """
         # Hash the core scientific content (not metadata or timestamps)
         content = {
@@ -135,6 +199,13 @@ class Trace(BaseModel):
         serialized = json.dumps(content, sort_keys=True, default=str)
         return hashlib.sha256(serialized.encode()).hexdigest()[:16]
 
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the trace, dropping the cached content_hash when fields are updated."""
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy.__dict__.pop("content_hash", None)
+        return copy
+
     # ========================================================================
     # Export Methods
     # ========================================================================
@@ -151,6 +222,7 @@ class Trace(BaseModel):
         self,
         path: str | Path,
         format: Literal["json", "cyclonedx", "spdx", "yaml"] = "json",
+        binary_counts: bool = False,
     ) -> Path:
         """
         Export trace to file.
@@ -158,6 +230,9 @@ class Trace(BaseModel):
         Args:
             path: Output file path
             format: Export format (json, cyclonedx, spdx, yaml)
+            binary_counts: For json, move histograms with more than
+                BINARY_COUNTS_THRESHOLD outcomes to a binary sidecar file
+                referenced from the JSON. Read such files with Trace.load().
 
         Returns:
             Path to exported file
@@ -171,7 +246,10 @@ class Trace(BaseModel):
         path = Path(path)
 
         if format == "json":
-            path.write_text(self.to_json())
+            if binary_counts and self.result and len(self.result.counts.raw) > BINARY_COUNTS_THRESHOLD:
+                path.write_text(self._to_json_with_sidecar(path))
+            else:
+                path.write_text(self.to_json())
         elif format == "cyclonedx":
             path.write_text(self._to_cyclonedx())
         elif format == "spdx":
@@ -185,6 +263,35 @@ class Trace(BaseModel):
 
         return path
 
+    def _to_json_with_sidecar(self, path: Path) -> str:
+        """Native JSON with the counts histogram stored next to it in binary."""
+        sidecar = path.with_suffix(".counts.bin")
+        data = self.to_dict()
+        if _write_counts_sidecar(sidecar, self.result.counts.raw):
+            counts = data["result"]["counts"]
+            counts["raw"] = {"$ref": sidecar.name}
+            counts.pop("probabilities", None)  # Derived; recomputed on load
+        return json.dumps(data, indent=2)
+
+    @classmethod
+    def load(cls, path: str | Path) -> Trace:
+        """
+        Load a trace from a native JSON export.
+
+        Resolves binary counts sidecars written with export(binary_counts=True).
+        """
+        path = Path(path)
+        content = path.read_bytes()
+        if b'"$ref"' not in content:
+            return cls.model_validate_json(content)
+
+        data = json.loads(content)
+        counts = (data.get("result") or {}).get("counts") or {}
+        raw = counts.get("raw")
+        if isinstance(raw, dict) and "$ref" in raw:
+            counts["raw"] = _read_counts_sidecar(path.parent / raw["$ref"])
+        return cls.model_validate(data)
+
     def _to_cyclonedx(self) -> str:
         """Export as CycloneDX SBOM with QBOM extension."""
         sbom = {
@@ -217,7 +324,7 @@ class Trace(BaseModel):
         # Embed full QBOM as extension
         sbom["extensions"] = {"qbom": self.to_dict()}
 
-        return json.dumps(sbom, indent=2, default=str)
+        return _dumps(sbom)
 
     def _generate_cyclonedx_components(self) -> list[dict]:
         """Generate CycloneDX components from environment."""
@@ -277,7 +384,7 @@ class Trace(BaseModel):
                 }
             ]
 
-        return json.dumps(spdx, indent=2, default=str)
+        return _dumps(spdx)
 
     def _generate_spdx_packages(self) -> list[dict]:
         """Generate SPDX packages from environment and experiment."""
@@ -0,0 +1,169 @@
+"""Tests for QBOM framework adapters."""
+
+import gc
+
+import pytest
+
+from qbom.core.session import Session
+
+
+class TestCirqAdapter:
+    def test_install_and_uninstall(self):
+        cirq = pytest.importorskip("cirq")
+        from qbom.adapters.cirq import CirqAdapter
+
+        original = cirq.Simulator.run
+        adapter = CirqAdapter(Session())
+        adapter.install()
+        assert cirq.Simulator.run is not original
+        assert cirq.Simulator.run.__wrapped__ is original
+
+        adapter.uninstall()
+        assert cirq.Simulator.run is original
+
+    def test_run_is_captured(self, monkeypatch):
+        cirq = pytest.importorskip("cirq")
+
+        session = Session.get()
+        monkeypatch.setattr(session, "_auto_save", False)
+        session._install_adapter_for("cirq")
+
+        q0, q1 = cirq.LineQubit.range(2)
+        circuit = cirq.Circuit([cirq.H(q0), cirq.CNOT(q0, q1), cirq.measure(q0, q1, key="m")])
+        cirq.Simulator().run(circuit, repetitions=20)
+        session.flush()
+
+        trace = session._traces[-1]
+        assert trace.hardware.backend == "cirq.Simulator"
+        assert trace.circuits[0].num_qubits == 2
+        assert trace.circuits[0].num_clbits == 2
+        assert sum(trace.result.counts.raw.values()) == 20
+
+    def test_simulate_is_captured_on_the_calling_thread(self, monkeypatch):
+        cirq = pytest.importorskip("cirq")
+
+        session = Session.get()
+        monkeypatch.setattr(session, "_auto_save", False)
+        session._install_adapter_for("cirq")
+
+        q0, q1 = cirq.LineQubit.range(2)
+        builder = session.current_builder
+        cirq.Simulator().simulate(cirq.Circuit([cirq.H(q0), cirq.CNOT(q0, q1)]))
+
+        # Recorded before simulate() returns, without waiting on the capture worker
+        assert builder._data["circuits"][-1].num_qubits == 2
+        assert builder._data["hardware"].backend == "cirq.Simulator (state vector)"
+        assert builder._data["execution"].shots == 1
+
+    def test_circuit_cache_entries_are_evicted(self):
+        cirq = pytest.importorskip("cirq")
+        from qbom.adapters.cirq import _CIRCUIT_CACHE, _circuit_to_model
+
+        gc.collect()
+        baseline = len(_CIRCUIT_CACHE)
+        q0 = cirq.LineQubit(0)
+        circuits = [cirq.Circuit([cirq.rx(i / 10).on(q0), cirq.measure(q0, key="m")]) for i in range(50)]
+        for circuit in circuits:
+            _circuit_to_model(circuit)
+            _circuit_to_model(circuit.freeze())
+        assert len(_CIRCUIT_CACHE) == baseline + 100
+
+        del circuits, circuit
+        gc.collect()
+        assert len(_CIRCUIT_CACHE) == baseline
+
+    def test_reused_resolver_is_captured_per_run(self, monkeypatch):
+        cirq = pytest.importorskip("cirq")
+        sympy = pytest.importorskip("sympy")
+
+        session = Session.get()
+        monkeypatch.setattr(session, "_auto_save", False)
+        session._install_adapter_for("cirq")
+
+        q0 = cirq.LineQubit(0)
+        theta = sympy.Symbol("theta")
+        circuit = cirq.Circuit([cirq.rx(theta).on(q0), cirq.measure(q0, key="m")])
+        simulator = cirq.Simulator()
+        params = {"theta": 0.0}
+        for i in range(20):
+            params["theta"] = float(i)
+            simulator.run(circuit, param_resolver=params, repetitions=1)
+        session.flush()
+
+        recorded = [trace.execution.parameters["theta"] for trace in list(session._traces)[-20:]]
+        assert recorded == [float(i) for i in range(20)]
+
+
+class TestQiskitAdapter:
+    def test_calibration_skips_only_incomplete_qubits(self):
+        from types import SimpleNamespace
+
+        from qbom.adapters.qiskit import _capture_calibration
+
+        def prop(value):
+            return (value, None)
+
+        qubit_props = [
+            {"T1": prop(1e-4), "T2": prop(8e-5), "frequency": prop(5e9), "readout_error": prop(0.02)},
+            {"T1": prop(1e-4), "frequency": prop(5e9), "readout_error": prop(0.03)},  # No T2
+            {"T1": prop(9e-5), "T2": prop(7e-5), "frequency": prop(5.1e9), "readout_error": prop(0.01)},
+        ]
+        cx = SimpleNamespace(
+            gate="cx",
+            qubits=[0, 2],
+            parameters=[
+                SimpleNamespace(name="gate_error", value=0.01),
+                SimpleNamespace(name="gate_length", value=3e-7),
+            ],
+        )
+        props = SimpleNamespace(last_update_date=None, qubit_property=qubit_props.__getitem__, gates=[cx])
+        backend = SimpleNamespace(num_qubits=3, properties=lambda: props)
+
+        calibration = _capture_calibration(backend)
+
+        assert [q.index for q in calibration.qubits] == [0, 2]
+        assert calibration.qubit(0).t1_us == pytest.approx(100.0)
+        assert calibration.gate_error("cx", (0, 2)) == 0.01
+
+    def test_unitary_parameters_are_hashed_in_full(self):
+        qiskit = pytest.importorskip("qiskit")
+        np = pytest.importorskip("numpy")
+        from qiskit.circuit.library import UnitaryGate
+
+        from qbom.adapters.qiskit import _circuit_to_model
+
+        identity = np.eye(32)
+        swapped = identity[[*range(15), 16, 15, *range(17, 32)]]
+        hashes = []
+        for matrix in (identity, swapped):
+            qc = qiskit.QuantumCircuit(5)
+            qc.append(UnitaryGate(matrix), range(5))
+            hashes.append(_circuit_to_model(qc).hash)
+
+        assert hashes[0] != hashes[1]
+
+    def test_in_place_edit_is_recaptured(self, monkeypatch):
+        qiskit = pytest.importorskip("qiskit")
+        qiskit_aer = pytest.importorskip("qiskit_aer")
+        from qiskit.circuit.library import XGate
+
+        session = Session.get()
+        monkeypatch.setattr(session, "_auto_save", False)
+        session._install_adapter_for("qiskit")
+
+        qc = qiskit.QuantumCircuit(1, 1)
+        qc.h(0)
+        qc.measure(0, 0)
+        backend = qiskit_aer.AerSimulator()
+        backend.run(qc, shots=10).result()
+        session.flush()
+        first = session._traces[-1].circuits[0]
+
+        qc.data[0] = qc.data[0].replace(operation=XGate())
+        backend.run(qc, shots=10).result()
+        session.flush()
+        trace = session._traces[-1]
+
+        assert trace.result.counts.raw == {"1": 10}
+        assert trace.circuits[0].gates.by_name == {"x": 1, "measure": 1}
+        assert trace.circuits[0].hash != first.hash
@@ -0,0 +1,117 @@
+"""Tests for QBOM trace analysis."""
+
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from qbom.analysis import (
+    GateDrift,
+    QubitDrift,
+    ValidationLevel,
+    analyze_drift,
+    batch_analyze_drift,
+    batch_compute_score,
+    compute_score,
+    validate_trace,
+    validate_traces,
+)
+from qbom.core.models import Calibration, GateProperties, Hardware, QubitProperties
+from qbom.core.trace import Trace, TraceBuilder
+
+
+def _hardware_trace(t1: float, gate_error: float):
+    calibration = Calibration(
+        timestamp=datetime(2024, 1, 1),
+        qubits=[QubitProperties(index=0, t1_us=t1, t2_us=80.0, readout_error=0.02)],
+        gates=[GateProperties(gate="cx", qubits=(0, 1), error=gate_error)],
+    )
+    hardware = Hardware(provider="IBM Quantum", backend="ibm_test", num_qubits=2, calibration=calibration)
+    return TraceBuilder().set_hardware(hardware).build()
+
+
+class TestScore:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_batch_matches_compute_score(self, workers):
+        from qbom.analysis.score import _compute_score
+
+        traces = [Trace(), _hardware_trace(100.0, 0.01), TraceBuilder().set_metadata(name="named").build()]
+        scores = batch_compute_score(traces, workers=workers)
+
+        assert scores == [_compute_score(trace) for trace in traces]
+        assert scores == [compute_score(trace) for trace in traces]
+
+
+class TestValidation:
+    def test_cached_result_cannot_be_mutated(self):
+        trace = Trace()
+        result = validate_trace(trace)
+
+        assert isinstance(result.issues, tuple)
+        with pytest.raises(AttributeError):
+            result.issues.append(result.issues[0])
+        assert validate_trace(trace) is result
+
+    def test_counts_are_derived_from_issues(self):
+        from qbom.analysis.validation import _NO_CIRCUIT_REPR, _NO_ENVIRONMENT, _NO_PACKAGES, ValidationResult
+
+        result = ValidationResult(
+            is_valid=False,
+            is_complete=False,
+            issues=(_NO_ENVIRONMENT, _NO_PACKAGES, _NO_CIRCUIT_REPR),
+            summary="",
+        )
+
+        assert (result.error_count, result.warning_count, result.info_count) == (1, 1, 1)
+
+    def test_level_values_are_strings(self):
+        assert ValidationLevel.ERROR.value == "error"
+        assert ValidationLevel("warning") is ValidationLevel.WARNING
+
+    def test_fast_fail_stops_at_first_error(self):
+        trace = Trace()
+        full = validate_trace(trace)
+        fast = validate_trace(trace, fast_fail=True)
+
+        assert not fast.is_valid
+        assert fast.is_valid == full.is_valid
+        assert [issue.level for issue in fast.issues] == [ValidationLevel.ERROR]
+        assert len(full.issues) > len(fast.issues)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_validate_traces_matches_validate_trace(self, workers):
+        from qbom.analysis.validation import _validate_trace
+
+        traces = [Trace(), TraceBuilder().set_metadata(name="named").build(), Trace()]
+        results = validate_traces(traces, workers=workers)
+
+        assert results == [_validate_trace(trace) for trace in traces]
+        assert [validate_trace(trace) for trace in traces] == results
+
+
+class TestDrift:
+    def test_drift_records_are_frozen(self):
+        qubit = QubitDrift(0, 100.0, 80.0, -20.0, None, None, None, None, None, None)
+        gate = GateDrift("cx", (0, 1), 0.01, 0.02, 100.0)
+
+        assert qubit.has_significant_drift
+        assert qubit.drift_summary == "T1 ↓20%"
+        assert gate.has_significant_drift
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            qubit.t1_change_percent = 0.0
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            gate.error_change_percent = 0.0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_batch_matches_analyze_drift(self, workers):
+        current = Calibration(
+            timestamp=datetime(2024, 1, 3),
+            qubits=[QubitProperties(index=0, t1_us=90.0, t2_us=80.0, readout_error=0.02)],
+            gates=[GateProperties(gate="cx", qubits=(0, 1), error=0.012)],
+        )
+        traces = [_hardware_trace(100.0, 0.01), Trace(), _hardware_trace(60.0, 0.03)]
+        results = batch_analyze_drift(traces, current, workers=workers)
+
+        assert results == [analyze_drift(trace, current) for trace in traces]
+        assert results[1] is None
+        assert results[0].overall_drift_score != results[2].overall_drift_score
@@ -1,13 +1,16 @@
 """Tests for QBOM core models."""
 
 import pytest
+import xxhash
 
+from qbom.core.hashing import hash_counts
 from qbom.core.models import (
     Circuit,
     Counts,
     Environment,
     GateCounts,
     Package,
+    Result,
 )
 from qbom.core.trace import Trace, TraceBuilder
 
@@ -56,6 +59,12 @@ class TestCircuit:
         assert "2q" in circuit.summary
         assert "depth 2" in circuit.summary
 
+    def test_shared_gate_counts(self):
+        first = GateCounts.shared({"h": 1, "cx": 1}, single_qubit=1, two_qubit=1, total=2)
+        second = GateCounts.shared({"cx": 1, "h": 1}, single_qubit=1, two_qubit=1, total=2)
+        assert first is second
+        assert GateCounts.shared({"h": 2}, single_qubit=2, two_qubit=0, total=2) is not first
+
 
 class TestCounts:
     def test_probabilities(self):
@@ -73,6 +82,42 @@ class TestCounts:
         assert top[0][0] == "00"
         assert top[1][0] == "11"
 
+    def test_large_counts_compare_after_serialization(self):
+        raw = {format(i, "012b"): i + 1 for i in range(2000)}
+        first = Counts(raw=raw, shots=sum(raw.values()))
+        second = Counts(raw=dict(raw), shots=first.shots)
+        first.model_dump_json()
+        second.model_dump_json()
+
+        assert first == second
+        assert first in [second]
+        assert first.top_results[0] == (format(1999, "012b"), 2000 / first.shots)
+
+
+class TestHashCounts:
+    def test_order_independent(self):
+        assert hash_counts({"00": 3, "11": 5}) == hash_counts({"11": 5, "00": 3})
+        assert hash_counts({"00": 3, "11": 5}) != hash_counts({"00": 5, "11": 3})
+
+    def test_digest_xor_collisions_do_not_collide(self):
+        # Any 65 64-bit digests are linearly dependent: find a subset whose
+        # digests XOR to zero, then split it into two histograms
+        basis: dict[int, tuple[int, int]] = {}  # top bit -> (digest, subset mask)
+        entries = [format(i, "08b") for i in range(65)]
+        for i, outcome in enumerate(entries):
+            value, mask = xxhash.xxh3_64_intdigest(f"{outcome}:1".encode()), 1 << i
+            while value and value.bit_length() in basis:
+                pivot, pivot_mask = basis[value.bit_length()]
+                value, mask = value ^ pivot, mask ^ pivot_mask
+            if not value:
+                break
+            basis[value.bit_length()] = (value, mask)
+        subset = [outcome for i, outcome in enumerate(entries) if mask >> i & 1]
+
+        first = {subset[0]: 1}
+        second = dict.fromkeys(subset[1:], 1)
+        assert hash_counts(first) != hash_counts(second)
+
 
 class TestTrace:
     def test_trace_id_generation(self):
@@ -91,6 +136,18 @@ class TestTrace:
         assert "id" in d
         assert "created_at" in d
 
+    def test_export_binary_counts_roundtrip(self, tmp_path):
+        raw = {format(i, "012b"): i + 1 for i in range(2000)}
+        counts = Counts(raw=raw, shots=sum(raw.values()))
+        trace = TraceBuilder().set_result(Result(counts=counts, hash="abc123")).build()
+
+        path = trace.export(tmp_path / "big.qbom.json", binary_counts=True)
+        assert (tmp_path / "big.qbom.counts.bin").exists()
+        assert '"$ref"' in path.read_text()
+
+        loaded = Trace.load(path)
+        assert loaded.result.counts.raw == raw
+
 
 class TestTraceBuilder:
     def test_builder_basic(self):
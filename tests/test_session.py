@@ -0,0 +1,184 @@
+"""Tests for the QBOM session."""
+
+import os
+import subprocess
+import sys
+from collections import deque
+
+import pytest
+
+from qbom.core.session import Session
+from qbom.core.trace import TraceBuilder
+
+
+def _trace(name: str):
+    return TraceBuilder().set_metadata(name=name).build()
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    session = Session()
+    monkeypatch.setattr(session, "_storage_path", tmp_path / "traces")
+    session._storage_path.mkdir()
+    yield session
+    if session._spill_path is not None:
+        session._spill_path.unlink(missing_ok=True)
+
+
+class TestIterAllTraces:
+    def test_evicted_traces_are_spilled(self, session):
+        session._auto_save = False
+        session._traces = deque(maxlen=3)
+        for i in range(5):
+            session._record(_trace(str(i)))
+
+        assert len(session._traces) == 3
+        assert session._spill_path is not None
+        assert [t.metadata.name for t in session.iter_all_traces()] == [str(i) for i in range(5)]
+
+    def test_unsaved_traces_spill_after_auto_save_is_enabled(self, session):
+        session._traces = deque(maxlen=3)
+        session._auto_save = False
+        for i in range(1, 8):
+            session._record(_trace(str(i)))
+        session._auto_save = True
+        for i in range(100, 103):
+            session._record(_trace(str(i)))
+
+        names = [t.metadata.name for t in session.iter_all_traces()]
+        assert names == ["1", "2", "3", "4", "5", "6", "7", "100", "101", "102"]
+
+    def test_saved_and_spilled_traces_stay_in_order(self, session):
+        session._traces = deque(maxlen=2)
+        for i in range(6):
+            session._auto_save = i % 2 == 0
+            session._record(_trace(str(i)))
+
+        assert [t.metadata.name for t in session.iter_all_traces()] == [str(i) for i in range(6)]
+
+
+class TestDeferredCapture:
+    def test_failed_task_warns_and_later_tasks_run(self, session):
+        done = []
+
+        def fail():
+            raise ValueError("backend went away")
+
+        with pytest.warns(RuntimeWarning, match="backend went away"):
+            session.defer(fail)
+            session.defer(done.append, "after")
+            session.flush()
+
+        assert done == ["after"]
+
+
+class TestCaptureControls:
+    def test_nothing_is_recorded_while_paused(self, monkeypatch):
+        cirq = pytest.importorskip("cirq")
+
+        session = Session.get()
+        monkeypatch.setattr(session, "_auto_save", False)
+        session._install_adapter_for("cirq")
+
+        q0 = cirq.LineQubit(0)
+        circuit = cirq.Circuit([cirq.X(q0), cirq.measure(q0, key="m")])
+        simulator = cirq.Simulator()
+        session.flush()
+        before = list(session._traces)
+
+        with session.pause():
+            assert session.paused
+            simulator.run(circuit, repetitions=5)
+        session.flush()
+        assert not session.paused
+        assert list(session._traces) == before
+
+        simulator.run(circuit, repetitions=5)
+        session.flush()
+        assert session._traces[-1] not in before
+
+    def test_disable_installs_no_hooks(self, tmp_path):
+        pytest.importorskip("cirq")
+        code = (
+            "import qbom, cirq\n"
+            "from qbom.core.session import Session\n"
+            "q = cirq.LineQubit(0)\n"
+            "cirq.Simulator().run(cirq.Circuit([cirq.X(q), cirq.measure(q, key='m')]), repetitions=5)\n"
+            "print(Session._instance is None, hasattr(cirq.Simulator.run, '__wrapped__'))\n"
+        )
+        env = {**os.environ, "HOME": str(tmp_path), "QBOM_DISABLE": "1"}
+        output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+        assert output.stdout.split() == ["True", "False"]
+        assert not (tmp_path / ".qbom" / "traces").exists()
+
+    def test_capture_level_validation(self, monkeypatch):
+        with pytest.raises(ValueError):
+            Session(capture_level="verbose")
+
+        monkeypatch.setenv("QBOM_CAPTURE_LEVEL", "FULL")
+        assert Session().capture_level == "full"
+        monkeypatch.setenv("QBOM_CAPTURE_LEVEL", "bogus")
+        assert Session().capture_level == "standard"
+
+    @pytest.mark.parametrize(("level", "has_qasm"), [("standard", False), ("full", True)])
+    def test_capture_level_controls_qasm(self, level, has_qasm):
+        qiskit = pytest.importorskip("qiskit")
+        from qbom.adapters.qiskit import QiskitAdapter
+
+        qc = qiskit.QuantumCircuit(21)
+        qc.h(0)
+        circuit = QiskitAdapter(Session(capture_level=level))._circuit_model(qc)
+
+        assert (circuit.qasm is not None) == has_qasm
+
+
+def _store(session, *trace_ids: str) -> None:
+    for trace_id in trace_ids:
+        (session._storage_path / f"{trace_id}.json").write_text("{}")
+    # Make sure the directory mtime moves even on coarse-grained filesystems
+    stat = session._storage_path.stat()
+    os.utime(session._storage_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestTraceIdResolution:
+    def test_exact_prefix_and_substring_matches(self, session):
+        _store(session, "qbom_1a2b3c4d", "qbom_9f8e7d6c", "custom")
+
+        def resolve(partial):
+            path = session._resolve_trace_id(partial)
+            return path.stem if path else None
+
+        assert resolve("qbom_1a2b3c4d") == "qbom_1a2b3c4d"
+        assert resolve("custom") == "custom"
+        assert resolve("qbom_9f") == "qbom_9f8e7d6c"
+        assert resolve("9f8e") == "qbom_9f8e7d6c"
+        assert resolve("3c4d") == "qbom_1a2b3c4d"
+        assert resolve("zzzz") is None
+
+    def test_ambiguous_prefix_resolves_to_first_sorted_id(self, session):
+        _store(session, "qbom_ab99ffff", "qbom_ab12ffff", "qbom_ab")
+
+        assert session._resolve_trace_id("ab").stem == "qbom_ab"
+        assert session._resolve_trace_id("ab1").stem == "qbom_ab12ffff"
+        assert session._resolve_trace_id("qbom_ab9").stem == "qbom_ab99ffff"
+
+    def test_index_is_rebuilt_when_storage_changes(self, session):
+        _store(session, "qbom_11111111")
+        assert session._trace_ids() == ["qbom_11111111"]
+
+        index_path = session._storage_path.parent / "index.txt"
+        stamp, *ids = index_path.read_text().splitlines()
+        assert int(stamp) == session._storage_path.stat().st_mtime_ns
+        assert ids == ["qbom_11111111"]
+
+        _store(session, "qbom_22222222")
+        assert session._resolve_trace_id("2222").stem == "qbom_22222222"
+        assert index_path.read_text().splitlines()[1:] == ["qbom_11111111", "qbom_22222222"]
+
+    def test_stale_index_file_is_ignored(self, session):
+        _store(session, "qbom_33333333")
+        (session._storage_path.parent / "index.txt").write_text("0\nqbom_deadbeef\n")
+
+        assert session._trace_ids() == ["qbom_33333333"]
+        assert session._resolve_trace_id("dead") is None